@@ -1,19 +1,79 @@
 # app/__init__.py
 
+import click
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
-from flask_migrate import Migrate
 from flask_login import LoginManager
 from .config import Config # Importa a configuração da mesma pasta
+from .cache import ObjectCache
+from .media import MediaStore
+from .autocomplete import Autocomplete
+from .ratelimit import RateLimiter
 
-# Cria as instâncias principais
-app = Flask(__name__)
-app.config.from_object(Config)
+# Extensões criadas sem app; são ligadas a cada aplicação em create_app()
+db = SQLAlchemy()
+login_manager = LoginManager()
+login_manager.login_view = 'auth.login' # Blueprint de autenticação
+login_manager.login_message = "Por favor, faça login para acessar esta página."
+login_manager.login_message_category = "warning"
+object_cache = ObjectCache() # Cache de leitura das páginas de detalhe/edição
+media_store = MediaStore() # Imagens dos produtos
+autocomplete = Autocomplete() # Índices de prefixo para /api/autocomplete
+rate_limiter = RateLimiter() # Limite de tentativas de login e cadastro
 
-db = SQLAlchemy(app)
-migrate = Migrate(app, db)
-login_manager = LoginManager(app)
-login_manager.login_view = 'login' # Nome da função de login em routes.py
 
+class LazyMigrateGroup(click.Group):
+    """Grupo `flask db` que só importa o Flask-Migrate (e o Alembic) quando é usado.
 
-from app import routes
\ No newline at end of file
+    Os workers que apenas servem requisições nunca pagam esse custo de importação.
+    """
+
+    def _load(self, ctx):
+        from flask.cli import ScriptInfo
+        from flask_migrate import Migrate
+        from flask_migrate.cli import db as db_group
+
+        app = ctx.ensure_object(ScriptInfo).load_app()
+        if 'migrate' not in app.extensions:
+            Migrate(app, db)
+        return db_group
+
+    def list_commands(self, ctx):
+        return self._load(ctx).list_commands(ctx)
+
+    def get_command(self, ctx, name):
+        return self._load(ctx).get_command(ctx, name)
+
+
+def create_app(config_class=Config):
+    """Cria e configura a aplicação (painel administrativo, marketplace e autenticação)."""
+    app = Flask(__name__)
+    app.config.from_object(config_class)
+
+    if app.config['PROXY_COUNT']:
+        # Confia no X-Forwarded-* apenas dos proxies conhecidos (IP real para o rate limit)
+        from werkzeug.middleware.proxy_fix import ProxyFix
+        count = app.config['PROXY_COUNT']
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=count, x_proto=count, x_host=count)
+
+    db.init_app(app)
+    login_manager.init_app(app)
+    object_cache.init_app(app)
+    media_store.init_app(app)
+    rate_limiter.init_app(app)
+
+    # Registo único dos modelos (também ativa o user_loader)
+    from app import models, changelog
+    changelog.register(db.session) # Log de alterações na mesma transação
+    autocomplete.register_defaults()
+
+    # Os blueprints só são importados aqui, quando a aplicação é criada
+    from app import admin, api, auth, marketplace
+    app.register_blueprint(auth.bp)
+    app.register_blueprint(api.bp, url_prefix='/api')
+    app.register_blueprint(marketplace.bp)
+    app.register_blueprint(admin.bp, url_prefix='/admin')
+
+    app.cli.add_command(LazyMigrateGroup('db', help='Migrações da base de dados (Flask-Migrate).'))
+
+    return app
@@ -0,0 +1,464 @@
+# app/admin.py
+# Painel administrativo: CRUD de categorias, produtos, clientes e cupons.
+
+import click
+from flask import Blueprint, render_template, request, redirect, url_for, flash
+from flask_login import login_required
+
+from app import db, object_cache, media_store, storefront, changelog, analytics
+from app.models import Category, Product, Customer, Coupon, Announcement, Order
+from app.sweeper import expire_coupons
+
+# cli_group=None mantém os comandos no nível raiz (flask expire-coupons)
+# Os formulários (WTForms) são importados dentro das views, só quando usados
+bp = Blueprint('admin', __name__, cli_group=None)
+
+@bp.route('/')
+@login_required
+def index():
+    """Página inicial do painel administrativo."""
+    product_count = Product.query.count()
+    category_count = Category.query.count()
+    customer_count = Customer.query.count()
+    return render_template(
+        'admin/home.html', 
+        product_count=product_count,
+        category_count=category_count,
+        customer_count=customer_count
+    )
+
+# --- CRUD Categorias ---
+@bp.route('/categories')
+def list_categories():
+    categories = Category.query.all()
+    return render_template('admin/list.html', title='Categorias', items=categories, fields=['id', 'name', 'description'], endpoint='category')
+
+@bp.route('/category/new', methods=['GET', 'POST'])
+def create_category():
+    from app.forms import CategoryForm
+    form = CategoryForm()
+    if form.validate_on_submit():
+        new_category = Category(name=form.name.data, description=form.description.data)
+        db.session.add(new_category)
+        db.session.commit()
+        flash('Categoria criada com sucesso!', 'success')
+        return redirect(url_for('.list_categories'))
+    return render_template('admin/form.html', form=form, title='Nova Categoria')
+
+@bp.route('/category/edit/<int:id>', methods=['GET', 'POST'])
+def edit_category(id):
+    from app.forms import CategoryForm
+    form = CategoryForm(obj=object_cache.get_or_404(Category, id))
+    if form.validate_on_submit():
+        category = Category.query.get_or_404(id)
+        category.name = form.name.data
+        category.description = form.description.data
+        db.session.commit()
+        object_cache.invalidate(Category, id)
+        flash('Categoria atualizada com sucesso!', 'success')
+        return redirect(url_for('.list_categories'))
+    return render_template('admin/form.html', form=form, title='Editar Categoria')
+
+@bp.route('/category/delete/<int:id>', methods=['POST'])
+def delete_category(id):
+    category = Category.query.get_or_404(id)
+    product_ids = [p.id for p in category.products]
+    db.session.delete(category)
+    db.session.commit()
+    object_cache.invalidate(Category, id)
+    # Os produtos da categoria são removidos em cascata
+    for product_id in product_ids:
+        object_cache.invalidate(Product, product_id)
+    flash('Categoria excluída com sucesso!', 'danger')
+    return redirect(url_for('.list_categories'))
+
+# --- CRUD Produtos ---
+@bp.route('/products')
+def list_products():
+    # ?sort=newest|cheapest e ?category=<id> usam os índices da vitrine
+    sort = request.args.get('sort')
+    if sort in storefront.ORDERINGS:
+        products = storefront.top(
+            Product, sort,
+            limit=storefront.clamp_limit(request.args.get('limit', type=int)),
+            category_id=request.args.get('category', type=int),
+        )
+    else:
+        products = Product.query.all()
+    return render_template('admin/list.html', title='Produtos', items=products, fields=['id', 'image_hash', 'name', 'price', 'stock', 'sku', 'category'], endpoint='product',
+                           bulk_actions=PRODUCT_BULK_ACTIONS, bulk_form=bulk_form(), categories=Category.query.order_by('name').all())
+
+@bp.route('/product/new', methods=['GET', 'POST'])
+def create_product():
+    from app.forms import ProductForm
+    form = ProductForm()
+    if form.validate_on_submit():
+        new_product = Product(
+            name=form.name.data,
+            description=form.description.data,
+            price=form.price.data,
+            stock=form.stock.data,
+            sku=form.sku.data,
+            origin=form.origin.data,
+            spiciness_level=form.spiciness_level.data,
+            category_id=form.category_id.data
+        )
+        if form.image.data:
+            try:
+                new_product.image_hash = media_store.save(form.image.data)
+            except ValueError as error:
+                form.image.errors.append(str(error))
+                return render_template('admin/form.html', form=form, title='Novo Produto')
+        db.session.add(new_product)
+        db.session.commit()
+        flash('Produto criado com sucesso!', 'success')
+        return redirect(url_for('.list_products'))
+    return render_template('admin/form.html', form=form, title='Novo Produto')
+
+@bp.route('/product/edit/<int:id>', methods=['GET', 'POST'])
+def edit_product(id):
+    from app.forms import ProductForm
+    form = ProductForm(obj=object_cache.get_or_404(Product, id))
+    if form.validate_on_submit():
+        product = Product.query.get_or_404(id)
+        product.name = form.name.data
+        product.description = form.description.data
+        product.price = form.price.data
+        product.stock = form.stock.data
+        product.sku = form.sku.data
+        product.origin = form.origin.data
+        product.spiciness_level = form.spiciness_level.data
+        product.category_id = form.category_id.data
+        if form.image.data:
+            try:
+                product.image_hash = media_store.save(form.image.data)
+            except ValueError as error:
+                db.session.rollback()
+                form.image.errors.append(str(error))
+                return render_template('admin/form.html', form=form, title='Editar Produto')
+        db.session.commit()
+        object_cache.invalidate(Product, id)
+        flash('Produto atualizado com sucesso!', 'success')
+        return redirect(url_for('.list_products'))
+    return render_template('admin/form.html', form=form, title='Editar Produto')
+
+@bp.route('/product/delete/<int:id>', methods=['POST'])
+def delete_product(id):
+    product = Product.query.get_or_404(id)
+    db.session.delete(product)
+    db.session.commit()
+    object_cache.invalidate(Product, id)
+    flash('Produto excluído com sucesso!', 'danger')
+    return redirect(url_for('.list_products'))
+
+# --- CRUD Clientes ---
+@bp.route('/customers')
+def list_customers():
+    customers = Customer.query.all()
+    return render_template('admin/list.html', title='Clientes', items=customers, fields=['id', 'first_name', 'last_name', 'email', 'phone'], endpoint='customer',
+                           bulk_actions=CUSTOMER_BULK_ACTIONS, bulk_form=bulk_form())
+
+@bp.route('/customer/new', methods=['GET', 'POST'])
+def create_customer():
+    from app.forms import CustomerForm
+    form = CustomerForm()
+    if form.validate_on_submit():
+        new_customer = Customer(
+            first_name=form.first_name.data,
+            last_name=form.last_name.data,
+            email=form.email.data,
+            phone=form.phone.data,
+            address=form.address.data,
+            city=form.city.data,
+            state=form.state.data,
+            zip_code=form.zip_code.data
+        )
+        db.session.add(new_customer)
+        db.session.commit()
+        flash('Cliente criado com sucesso!', 'success')
+        return redirect(url_for('.list_customers'))
+    return render_template('admin/form.html', form=form, title='Novo Cliente')
+
+@bp.route('/customer/edit/<int:id>', methods=['GET', 'POST'])
+def edit_customer(id):
+    from app.forms import CustomerForm
+    form = CustomerForm(obj=object_cache.get_or_404(Customer, id))
+    if form.validate_on_submit():
+        customer = Customer.query.get_or_404(id)
+        customer.first_name = form.first_name.data
+        customer.last_name = form.last_name.data
+        customer.email = form.email.data
+        customer.phone = form.phone.data
+        customer.address = form.address.data
+        customer.city = form.city.data
+        customer.state = form.state.data
+        customer.zip_code = form.zip_code.data
+        db.session.commit()
+        object_cache.invalidate(Customer, id)
+        flash('Cliente atualizado com sucesso!', 'success')
+        return redirect(url_for('.list_customers'))
+    return render_template('admin/form.html', form=form, title='Editar Cliente')
+
+@bp.route('/customer/delete/<int:id>', methods=['POST'])
+def delete_customer(id):
+    customer = Customer.query.get_or_404(id)
+    # Os pedidos são o histórico de vendas (e a base dos relatórios): não são apagados junto
+    if customer.orders.count() > 0:
+        flash('Não é possível excluir um cliente que possui pedidos.', 'danger')
+        return redirect(url_for('.list_customers'))
+    db.session.delete(customer)
+    db.session.commit()
+    object_cache.invalidate(Customer, id)
+    flash('Cliente excluído com sucesso!', 'danger')
+    return redirect(url_for('.list_customers'))
+
+# --- CRUD Cupons ---
+@bp.route('/coupons')
+def list_coupons():
+    # ?active=1 lista apenas os ativos; a expiração é aplicada pelo sweeper
+    if request.args.get('active', type=int):
+        coupons = Coupon.query.filter_by(is_active=True).all()
+    else:
+        coupons = Coupon.query.all()
+    return render_template('admin/list.html', title='Cupons', items=coupons, fields=['id', 'code', 'discount_type', 'value', 'is_active'], endpoint='coupon',
+                           bulk_actions=COUPON_BULK_ACTIONS, bulk_form=bulk_form())
+
+@bp.route('/coupon/new', methods=['GET', 'POST'])
+def create_coupon():
+    from app.forms import CouponForm
+    form = CouponForm()
+    if form.validate_on_submit():
+        new_coupon = Coupon(
+            code=form.code.data,
+            discount_type=form.discount_type.data,
+            value=form.value.data,
+            expiration_date=form.expiration_date.data,
+            is_active=form.is_active.data
+        )
+        db.session.add(new_coupon)
+        db.session.commit()
+        flash('Cupom criado com sucesso!', 'success')
+        return redirect(url_for('.list_coupons'))
+    return render_template('admin/form.html', form=form, title='Novo Cupom')
+
+@bp.route('/coupon/edit/<int:id>', methods=['GET', 'POST'])
+def edit_coupon(id):
+    from app.forms import CouponForm
+    form = CouponForm(obj=object_cache.get_or_404(Coupon, id))
+    if form.validate_on_submit():
+        coupon = Coupon.query.get_or_404(id)
+        coupon.code = form.code.data
+        coupon.discount_type = form.discount_type.data
+        coupon.value = form.value.data
+        coupon.expiration_date = form.expiration_date.data
+        coupon.is_active = form.is_active.data
+        db.session.commit()
+        object_cache.invalidate(Coupon, id)
+        flash('Cupom atualizado com sucesso!', 'success')
+        return redirect(url_for('.list_coupons'))
+    return render_template('admin/form.html', form=form, title='Editar Cupom')
+
+@bp.route('/coupon/delete/<int:id>', methods=['POST'])
+def delete_coupon(id):
+    coupon = Coupon.query.get_or_404(id)
+    db.session.delete(coupon)
+    db.session.commit()
+    object_cache.invalidate(Coupon, id)
+    flash('Cupom excluído com sucesso!', 'danger')
+    return redirect(url_for('.list_coupons'))
+
+# --- Ações em Massa ---
+# Cada ação roda como um único UPDATE/DELETE sobre os ids selecionados, em uma transação.
+PRODUCT_BULK_ACTIONS = [
+    ('change_category', 'Alterar categoria'),
+    ('adjust_price', 'Ajustar preço (%)'),
+    ('restock', 'Repor estoque'),
+    ('delete', 'Excluir'),
+]
+CUSTOMER_BULK_ACTIONS = [
+    ('delete', 'Excluir'),
+]
+COUPON_BULK_ACTIONS = [
+    ('deactivate', 'Desativar'),
+    ('activate', 'Ativar'),
+    ('delete', 'Excluir'),
+]
+
+def bulk_form():
+    from app.forms import BulkActionForm
+    return BulkActionForm()
+
+def bulk_request_valid():
+    """Confere o token CSRF do formulário de ações em massa."""
+    if bulk_form().validate_on_submit():
+        return True
+    flash('Sessão expirada ou requisição inválida. Tente novamente.', 'danger')
+    return False
+
+def selected_ids():
+    """Ids marcados na lista (checkboxes com name="ids")."""
+    return sorted({int(value) for value in request.form.getlist('ids') if value.isdigit()})
+
+def run_bulk(model, ids, values=None):
+    """Aplica um UPDATE (values) ou DELETE (values=None) a todos os ids de uma vez."""
+    query = model.query.filter(model.id.in_(ids))
+    if values is None:
+        count = query.delete(synchronize_session=False)
+        changelog.record(db.session, model, ids, 'delete')
+    else:
+        count = query.update(values, synchronize_session=False)
+        changelog.record(db.session, model, ids, 'update')
+    db.session.commit()
+    for id in ids:
+        object_cache.invalidate(model, id)
+    return count
+
+def flash_bulk_result(count, ids, verb):
+    skipped = len(ids) - count
+    message = f'{count} de {len(ids)} itens {verb}.'
+    if skipped:
+        message += f' {skipped} não encontrados.'
+    flash(message, 'success' if count else 'warning')
+
+@bp.route('/products/bulk', methods=['POST'])
+@login_required
+def bulk_products():
+    if not bulk_request_valid():
+        return redirect(url_for('.list_products'))
+    ids = selected_ids()
+    action = request.form.get('action')
+    if not ids:
+        flash('Nenhum produto selecionado.', 'warning')
+        return redirect(url_for('.list_products'))
+
+    if action == 'change_category':
+        category_id = request.form.get('category_id', type=int)
+        if category_id is None or db.session.get(Category, category_id) is None:
+            flash('Selecione uma categoria válida.', 'danger')
+            return redirect(url_for('.list_products'))
+        count = run_bulk(Product, ids, {Product.category_id: category_id})
+        flash_bulk_result(count, ids, 'movidos de categoria')
+    elif action == 'adjust_price':
+        percent = request.form.get('percent', type=float)
+        if percent is None or percent <= -100:
+            flash('Informe um percentual maior que -100.', 'danger')
+            return redirect(url_for('.list_products'))
+        count = run_bulk(Product, ids, {Product.price: db.func.round(Product.price * (1 + percent / 100), 2)})
+        flash_bulk_result(count, ids, 'com preço ajustado')
+    elif action == 'restock':
+        quantity = request.form.get('quantity', type=int)
+        if quantity is None or quantity <= 0:
+            flash('Informe uma quantidade positiva.', 'danger')
+            return redirect(url_for('.list_products'))
+        count = run_bulk(Product, ids, {Product.stock: Product.stock + quantity})
+        flash_bulk_result(count, ids, 'repostos')
+    elif action == 'delete':
+        count = run_bulk(Product, ids)
+        flash_bulk_result(count, ids, 'excluídos')
+    else:
+        flash('Ação inválida.', 'danger')
+    return redirect(url_for('.list_products'))
+
+@bp.route('/customers/bulk', methods=['POST'])
+@login_required
+def bulk_customers():
+    if not bulk_request_valid():
+        return redirect(url_for('.list_customers'))
+    ids = selected_ids()
+    action = request.form.get('action')
+    if not ids:
+        flash('Nenhum cliente selecionado.', 'warning')
+    elif action == 'delete':
+        # Mesma regra da exclusão individual: clientes com pedidos são mantidos
+        with_orders = set(db.session.scalars(
+            db.select(Order.customer_id).where(Order.customer_id.in_(ids)).distinct()
+        ))
+        deletable = [id for id in ids if id not in with_orders]
+        if with_orders:
+            flash(f'{len(with_orders)} clientes com pedidos não foram excluídos.', 'danger')
+        if deletable:
+            count = run_bulk(Customer, deletable)
+            flash_bulk_result(count, deletable, 'excluídos')
+    else:
+        flash('Ação inválida.', 'danger')
+    return redirect(url_for('.list_customers'))
+
+@bp.route('/coupons/bulk', methods=['POST'])
+@login_required
+def bulk_coupons():
+    if not bulk_request_valid():
+        return redirect(url_for('.list_coupons'))
+    ids = selected_ids()
+    action = request.form.get('action')
+    if not ids:
+        flash('Nenhum cupom selecionado.', 'warning')
+    elif action == 'deactivate':
+        count = run_bulk(Coupon, ids, {Coupon.is_active: False})
+        flash_bulk_result(count, ids, 'desativados')
+    elif action == 'activate':
+        count = run_bulk(Coupon, ids, {Coupon.is_active: True})
+        flash_bulk_result(count, ids, 'ativados')
+    elif action == 'delete':
+        count = run_bulk(Coupon, ids)
+        flash_bulk_result(count, ids, 'excluídos')
+    else:
+        flash('Ação inválida.', 'danger')
+    return redirect(url_for('.list_coupons'))
+
+# --- Relatórios de Vendas ---
+@bp.route('/analytics')
+@login_required
+def sales_analytics():
+    """Receita e unidades por dimensão, lidas dos rollups diários."""
+    dimension = request.args.get('dimension', 'category')
+    if dimension not in analytics.DIMENSIONS:
+        dimension = 'category'
+    days = max(1, min(request.args.get('days', 365, type=int), 3 * 365))
+    # Só leitura: o rollup é atualizado fora da requisição (flask analytics-refresh)
+    report = analytics.report(db.session, dimension, days)
+    return render_template('admin/analytics.html', title='Vendas', report=report,
+                           dimension=dimension, days=days, dimensions=ANALYTICS_DIMENSIONS,
+                           built=analytics.is_built(db.session))
+
+ANALYTICS_DIMENSIONS = [
+    ('category', 'Categoria'),
+    ('state', 'Estado'),
+    ('origin', 'Origem'),
+    ('spiciness', 'Picância'),
+]
+
+# --- Comandos de linha de comando ---
+@bp.cli.command('analytics-refresh')
+def analytics_refresh_command():
+    """Atualiza os rollups de vendas a partir do ChangeLog (para agendar no cron)."""
+    days = analytics.refresh(db.session)
+    click.echo(f'{len(days)} dias recalculados.')
+
+@bp.cli.command('expire-coupons')
+def expire_coupons_command():
+    """Desativa os cupons vencidos (para agendar no cron)."""
+    count = expire_coupons(Coupon, object_cache=object_cache)
+    click.echo(f'{count} cupons expirados desativados.')
+
+@bp.cli.command('check-query-plans')
+def check_query_plans():
+    """Confere com EXPLAIN QUERY PLAN que as consultas da vitrine não varrem tabelas."""
+    category_ids = [c.id for c in Category.query.with_entities(Category.id)]
+    statements = []
+    # Produtos (painel e vitrine) e anúncios (/anuncios?sort=) usam os mesmos padrões de consulta
+    for model in (Product, Announcement):
+        statements += [storefront.top_query(model, order, 20) for order in storefront.ORDERINGS]
+        statements += [storefront.top_query(model, order, 20, category_id=category_ids[0] if category_ids else 1)
+                       for order in storefront.ORDERINGS]
+        for chunk in storefront.chunked(category_ids):
+            statements += [storefront.top_ids_per_category_statement(model, chunk, order) for order in storefront.ORDERINGS]
+
+    failed = False
+    for statement in statements:
+        scans = storefront.full_scans(storefront.query_plan(db.session, statement))
+        if scans:
+            failed = True
+            click.echo(f'VARREDURA COMPLETA: {scans}', err=True)
+    if failed:
+        raise SystemExit(1)
+    click.echo(f'{len(statements)} consultas verificadas, nenhuma varredura completa.')
@@ -0,0 +1,190 @@
+# app/analytics.py
+# Relatórios de vendas a partir de rollups diários (tabela daily_sales).
+#
+# O rollup lê apenas pedidos e itens: o estado do cliente e a categoria, origem
+# e picância do produto são copiados para o pedido no momento da compra, então
+# alterar um cadastro não muda as vendas já contadas.
+#
+# A atualização é incremental e roda fora das requisições (`flask
+# analytics-refresh`, no cron): os pedidos alterados desde a última execução
+# são lidos do ChangeLog e só os dias afetados são recalculados, com um
+# INSERT ... SELECT ... GROUP BY por dimensão. A tabela daily_sales_item guarda
+# o dia em que cada item foi contado, para que um pedido que mudou de dia ou
+# foi removido também seja descontado do dia antigo.
+#
+# A agregação mensal é vetorizada com pandas (listado nos requirements); se ele
+# não estiver instalado, o mesmo resultado é calculado num laço em Python puro.
+from datetime import date, datetime, time, timedelta
+
+from sqlalchemy import String, cast, delete, func, insert, literal, or_, select
+
+from app import changelog
+from app.models import Category, ChangeLogCursor, DailySales, DailySalesItem, Order, OrderItem
+
+CONSUMER = 'analytics:daily_sales'
+GRAIN = ('day', 'dimension', 'key', 'revenue', 'units')
+
+# Dimensões dos relatórios -> coluna de origem (um rollup por dimensão)
+DIMENSIONS = {
+    'category': OrderItem.category_id,
+    'state': Order.state,
+    'origin': OrderItem.origin,
+    'spiciness': OrderItem.spiciness_level,
+}
+
+
+def _rollup_selects(*where):
+    """Um SELECT ... GROUP BY dia, valor para cada dimensão."""
+    day = func.date(Order.created_at)
+    for dimension, column in DIMENSIONS.items():
+        key = func.coalesce(cast(column, String), '')
+        yield (
+            select(
+                day,
+                literal(dimension),
+                key,
+                func.sum(OrderItem.quantity * OrderItem.unit_price),
+                func.sum(OrderItem.quantity),
+            )
+            .select_from(OrderItem)
+            .join(Order, OrderItem.order_id == Order.id)
+            .where(Order.status != 'cancelled', *where)
+            .group_by(day, key)
+        )
+
+
+def _insert_rollups(session, *where):
+    for statement in _rollup_selects(*where):
+        session.execute(insert(DailySales).from_select(GRAIN, statement))
+
+
+def _insert_item_days(session, *where):
+    statement = (
+        select(OrderItem.id, OrderItem.order_id, func.date(Order.created_at))
+        .join(Order, OrderItem.order_id == Order.id)
+        .where(*where)
+    )
+    session.execute(insert(DailySalesItem).from_select(('order_item_id', 'order_id', 'day'), statement))
+
+
+def is_built(session):
+    return session.get(ChangeLogCursor, CONSUMER) is not None
+
+
+def rebuild(session):
+    """Reconstrói todo o rollup e posiciona o cursor no fim do ChangeLog."""
+    consumer = changelog.Consumer(session, CONSUMER)
+    position = changelog.last_seq(session)
+    session.execute(delete(DailySales))
+    session.execute(delete(DailySalesItem))
+    _insert_rollups(session)
+    _insert_item_days(session)
+    consumer.commit(position)
+
+
+def recompute_days(session, days):
+    """Recalcula o rollup apenas dos dias informados."""
+    if not days:
+        return
+    ranges = [
+        Order.created_at.between(datetime.combine(day, time.min), datetime.combine(day, time.max))
+        for day in days
+    ]
+    session.execute(delete(DailySales).where(DailySales.day.in_(days)))
+    _insert_rollups(session, or_(*ranges))
+
+
+def _counted_days(session, item_ids):
+    return set(session.scalars(
+        select(DailySalesItem.day).where(DailySalesItem.order_item_id.in_(item_ids)).distinct()
+    ))
+
+
+def refresh(session):
+    """Aplica ao rollup os pedidos alterados desde a última execução. Retorna os dias recalculados."""
+    if not is_built(session):
+        # Primeira execução: carrega o histórico inteiro de uma vez
+        rebuild(session)
+        return set()
+
+    consumer = changelog.Consumer(session, CONSUMER, tables=[Order.__tablename__, OrderItem.__tablename__])
+
+    touched = set()
+    for batch in consumer.batches():
+        changes = changelog.changed_ids(batch)
+        order_ids = set().union(*changes.get(Order.__tablename__, ()))
+        item_ids = set().union(*changes.get(OrderItem.__tablename__, ()))
+        if order_ids:
+            # Itens atuais dos pedidos alterados e os que já foram contados (inclusive os removidos)
+            item_ids |= set(session.scalars(select(OrderItem.id).where(OrderItem.order_id.in_(order_ids))))
+            item_ids |= set(session.scalars(
+                select(DailySalesItem.order_item_id).where(DailySalesItem.order_id.in_(order_ids))
+            ))
+        if not item_ids:
+            continue
+
+        days = _counted_days(session, item_ids)
+        session.execute(delete(DailySalesItem).where(DailySalesItem.order_item_id.in_(item_ids)))
+        _insert_item_days(session, OrderItem.id.in_(item_ids))
+        days |= _counted_days(session, item_ids)
+
+        recompute_days(session, days)
+        touched |= days
+        # Ao avançar, o cursor faz o commit do rollup recalculado na mesma transação
+    return touched
+
+
+def _labels(session, dimension, keys):
+    if dimension != 'category':
+        return {key: key or 'N/A' for key in keys}
+    ids = [int(key) for key in keys if key]
+    names = {str(id): name for id, name in session.execute(select(Category.id, Category.name).where(Category.id.in_(ids)))}
+    return {key: names.get(key, 'N/A') for key in keys}
+
+
+def report(session, dimension='category', days=365, end=None):
+    """Receita e unidades por dimensão e por mês no período, lidas do rollup.
+
+    Usa pandas (agregação vetorizada) quando instalado; o caminho em Python
+    puro é só o fallback opcional.
+    """
+    if dimension not in DIMENSIONS:
+        raise ValueError(f'Dimensão desconhecida: {dimension}')
+    end = end or date.today()
+    start = end - timedelta(days=days - 1)
+    rows = session.execute(
+        select(DailySales.day, DailySales.key, DailySales.revenue, DailySales.units)
+        .where(DailySales.dimension == dimension, DailySales.day.between(start, end))
+    ).all()
+
+    try:
+        import pandas as pd
+    except ImportError:
+        pd = None
+
+    if pd is not None and rows:
+        frame = pd.DataFrame(rows, columns=['day', 'key', 'revenue', 'units'])
+        frame['day'] = pd.to_datetime(frame['day'])
+        by_key = frame.groupby('key')[['revenue', 'units']].sum().sort_values('revenue', ascending=False)
+        by_month = frame.groupby(frame['day'].dt.to_period('M'))[['revenue', 'units']].sum()
+        totals = [(key, float(row.revenue), int(row.units)) for key, row in by_key.iterrows()]
+        months = [(str(period), float(row.revenue), int(row.units)) for period, row in by_month.iterrows()]
+    else:
+        per_key, per_month = {}, {}
+        for day, key, revenue, units in rows:
+            for bucket, name in ((per_key, key), (per_month, day.strftime('%Y-%m'))):
+                current = bucket.setdefault(name, [0.0, 0])
+                current[0] += revenue
+                current[1] += units
+        totals = sorted(((key, r, u) for key, (r, u) in per_key.items()), key=lambda t: t[1], reverse=True)
+        months = sorted((month, r, u) for month, (r, u) in per_month.items())
+
+    labels = _labels(session, dimension, [key for key, _, _ in totals])
+    return {
+        'start': start,
+        'end': end,
+        'totals': [(labels[key], revenue, units) for key, revenue, units in totals],
+        'months': months,
+        'revenue': sum(revenue for _, revenue, _ in totals),
+        'units': sum(units for _, _, units in totals),
+    }
@@ -0,0 +1,154 @@
+# app/api.py
+# API JSON: autocomplete do painel e leitura dos recursos para apps e parceiros.
+
+import json
+from datetime import date, datetime
+from functools import wraps
+
+from flask import Blueprint, Response, request, abort
+from flask_login import current_user
+from sqlalchemy import select
+from werkzeug.exceptions import HTTPException
+
+try:
+    import orjson
+except ImportError:  # orjson é opcional; sem ele usa o json da stdlib
+    orjson = None
+
+from app import db, autocomplete
+from app.models import Product, Category, Announcement, Customer, Coupon
+
+bp = Blueprint('api', __name__)
+
+
+@bp.errorhandler(HTTPException)
+def handle_http_error(error):
+    """Erros das rotas da API saem em JSON, nunca como página HTML."""
+    return json_error(error.description, error.code)
+
+
+def api_login_required(view):
+    """Como o login_required, mas responde 401 em JSON em vez de redirecionar para o login."""
+    @wraps(view)
+    def wrapped(*args, **kwargs):
+        if not current_user.is_authenticated:
+            abort(401, 'Autenticação necessária.')
+        return view(*args, **kwargs)
+    return wrapped
+
+
+@bp.route('/autocomplete')
+@api_login_required
+def autocomplete_lookup():
+    """Sugestões por prefixo: /api/autocomplete?type=product|customer|category&q=..."""
+    type = request.args.get('type', 'product')
+    if type not in autocomplete.types:
+        abort(400, f'Tipo desconhecido: {type}')
+    limit = min(request.args.get('limit', 10, type=int), 50)
+    matches = autocomplete.search(type, request.args.get('q', ''), limit)
+    return json_response([{'id': id, 'label': label} for id, label in matches])
+
+
+# --- API REST (somente leitura) ---
+# Cada recurso aponta para o modelo e diz se pode ser lido sem login.
+RESOURCES = {
+    'products': (Product, True),
+    'categories': (Category, True),
+    'announcements': (Announcement, True),
+    'customers': (Customer, False),
+    'coupons': (Coupon, False),
+}
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 500
+
+
+def _default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f'Tipo não serializável: {type(value).__name__}')
+
+
+def json_response(payload, status=200):
+    """Serializa com orjson quando disponível (bem mais rápido que o json da stdlib)."""
+    if orjson is not None:
+        body = orjson.dumps(payload)
+    else:
+        body = json.dumps(payload, default=_default, separators=(',', ':'))
+    return Response(body, status=status, mimetype='application/json')
+
+
+def json_error(message, status):
+    return json_response({'error': message}, status)
+
+
+def _resource(name):
+    if name not in RESOURCES:
+        abort(404, f'Recurso desconhecido: {name}')
+    model, public = RESOURCES[name]
+    if not public and not current_user.is_authenticated:
+        abort(401, 'Autenticação necessária.')
+    return model
+
+
+def _columns(model):
+    """Colunas pedidas em ?fields=a,b (o id é sempre incluído)."""
+    table = model.__table__.columns
+    fields = request.args.get('fields')
+    if not fields:
+        return list(table)
+    names = ['id'] + [name.strip() for name in fields.split(',') if name.strip() and name.strip() != 'id']
+    unknown = [name for name in names if name not in table]
+    if unknown:
+        raise ValueError(f'Campos desconhecidos: {", ".join(unknown)}')
+    return [table[name] for name in names]
+
+
+def _rows(statement, columns):
+    keys = [column.key for column in columns]
+    return [dict(zip(keys, row)) for row in db.session.execute(statement)]
+
+
+@bp.route('/<resource>')
+def list_resource(resource):
+    """Lista com paginação por chave (?after=<id>&limit=N), ?fields= e ?ids=1,2,3."""
+    model = _resource(resource)
+    try:
+        columns = _columns(model)
+    except ValueError as error:
+        return json_error(str(error), 400)
+    statement = select(*columns).order_by(model.id)
+
+    ids = request.args.get('ids')
+    if ids is not None:
+        try:
+            ids = sorted({int(id) for id in ids.split(',') if id.strip()})
+        except ValueError:
+            return json_error('ids deve ser uma lista de inteiros separados por vírgula.', 400)
+        if len(ids) > MAX_LIMIT:
+            return json_error(f'No máximo {MAX_LIMIT} ids por requisição.', 400)
+        return json_response({'data': _rows(statement.where(model.id.in_(ids)), columns)})
+
+    limit = max(1, min(request.args.get('limit', DEFAULT_LIMIT, type=int), MAX_LIMIT))
+    after = request.args.get('after', type=int)
+    if after is not None:
+        statement = statement.where(model.id > after)
+    # Busca um a mais para saber se existe uma próxima página
+    data = _rows(statement.limit(limit + 1), columns)
+    next_cursor = None
+    if len(data) > limit:
+        data = data[:limit]
+        next_cursor = data[-1]['id']
+    return json_response({'data': data, 'next': next_cursor})
+
+
+@bp.route('/<resource>/<int:id>')
+def get_resource(resource, id):
+    model = _resource(resource)
+    try:
+        columns = _columns(model)
+    except ValueError as error:
+        return json_error(str(error), 400)
+    data = _rows(select(*columns).where(model.id == id), columns)
+    if not data:
+        return json_error('Não encontrado.', 404)
+    return json_response(data[0])
@@ -0,0 +1,73 @@
+# app/auth.py
+# Autenticação: login, logout e cadastro de utilizadores.
+
+from flask import Blueprint, render_template, flash, redirect, url_for
+from flask_login import current_user, login_user, logout_user, login_required
+from sqlalchemy.exc import IntegrityError
+
+from app import db, rate_limiter
+from app.models import User
+
+# Os formulários (WTForms) são importados dentro das views, só quando usados
+bp = Blueprint('auth', __name__)
+
+
+# --- Rotas de Autenticação (Com Lógica Completa) ---
+
+@bp.route('/login', methods=['GET', 'POST'])
+@rate_limiter.limit('login', ip='30/minute', username='5/minute')
+def login():
+    if current_user.is_authenticated:
+        return redirect(url_for('marketplace.index'))
+    
+    from app.forms import LoginForm
+    form = LoginForm()
+    if form.validate_on_submit():
+        user = User.query.filter_by(username=form.username.data).first()
+        if user is None or not user.check_password(form.password.data):
+            rate_limiter.failed('login', username=form.username.data)
+            flash('Utilizador ou senha inválidos.', 'danger')
+            return redirect(url_for('.login'))
+        
+        login_user(user)
+        return redirect(url_for('marketplace.index'))
+        
+    return render_template('login.html', form=form)
+
+@bp.route('/logout')
+@login_required
+def logout():
+    logout_user()
+    flash('Sessão terminada com sucesso.', 'success')
+    return redirect(url_for('.login'))
+
+@bp.route('/cadastro', methods=['GET', 'POST'])
+@rate_limiter.limit('cadastro', ip='5/minute')
+def cadastro():
+    # Se o utilizador já estiver logado, não pode aceder à página de registo
+    if current_user.is_authenticated:
+        return redirect(url_for('marketplace.index'))
+
+    from app.forms import RegistrationForm
+    form = RegistrationForm()
+    if form.validate_on_submit():
+        # Cria um novo User com os dados do formulário
+        user = User(username=form.username.data, email=form.email.data)
+        # Define a senha 
+        user.set_password(form.password.data)
+        # Insere direto: as restrições UNIQUE do banco decidem, mesmo com cadastros simultâneos
+        db.session.add(user)
+        try:
+            db.session.commit()
+        except IntegrityError as error:
+            db.session.rollback()
+            # O SQLite só informa a primeira restrição violada: a consulta completa os demais campos
+            mapped = form.unique_violation(error)
+            if not form.check_taken() and not mapped:
+                raise
+            return render_template('cadastro.html', title='Registar', form=form)
+
+        flash('Parabéns, o seu registo foi efetuado com sucesso!', 'success')
+        return redirect(url_for('.login')) # Redireciona para a página de login
+
+    return render_template('cadastro.html', title='Registar', form=form)
@@ -0,0 +1,181 @@
+# app/autocomplete.py
+import threading
+import unicodedata
+from bisect import bisect_left
+
+
+def normalize(text):
+    """Minúsculas e sem acentos, para que 'pimenta' encontre 'Pimenta-do-Reino' e 'açafrão' encontre 'Acafrao'."""
+    text = unicodedata.normalize('NFKD', text or '')
+    return ''.join(ch for ch in text if not unicodedata.combining(ch)).casefold().strip()
+
+
+class PrefixIndex:
+    """Array ordenado de termos normalizados, consultado por prefixo com bisect.
+
+    Cada item (id) pode ter vários termos (ex.: SKU e nome). As listas `_keys`
+    e `_ids` são paralelas; inserções e remoções mantêm a ordem.
+    """
+
+    def __init__(self):
+        self._keys = []
+        self._ids = []
+        self._terms = {}   # id -> termos normalizados
+        self._labels = {}  # id -> texto exibido
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._keys)
+
+    def _insert(self, key, id):
+        pos = bisect_left(self._keys, key)
+        self._keys.insert(pos, key)
+        self._ids.insert(pos, id)
+
+    def _delete(self, key, id):
+        pos = bisect_left(self._keys, key)
+        while pos < len(self._keys) and self._keys[pos] == key:
+            if self._ids[pos] == id:
+                del self._keys[pos]
+                del self._ids[pos]
+                return
+            pos += 1
+
+    def add(self, id, terms, label):
+        """Insere ou substitui os termos de um item."""
+        keys = sorted({normalize(term) for term in terms if term} - {''})
+        with self._lock:
+            for key in self._terms.pop(id, ()):
+                self._delete(key, id)
+            for key in keys:
+                self._insert(key, id)
+            self._terms[id] = keys
+            self._labels[id] = label
+
+    def load(self, items):
+        """Carga inicial em lote: [(id, terms, label)] ordenado uma única vez."""
+        pairs = []
+        terms, labels = {}, {}
+        for id, item_terms, label in items:
+            keys = sorted({normalize(term) for term in item_terms if term} - {''})
+            terms[id] = keys
+            labels[id] = label
+            pairs.extend((key, id) for key in keys)
+        pairs.sort()
+        with self._lock:
+            self._keys = [key for key, _ in pairs]
+            self._ids = [id for _, id in pairs]
+            self._terms = terms
+            self._labels = labels
+
+    def remove(self, id):
+        with self._lock:
+            for key in self._terms.pop(id, ()):
+                self._delete(key, id)
+            self._labels.pop(id, None)
+
+    def search(self, prefix, limit=10):
+        """Retorna até `limit` pares (id, label) cujos termos começam com o prefixo."""
+        prefix = normalize(prefix)
+        if not prefix:
+            return []
+        results = []
+        seen = set()
+        with self._lock:
+            keys, ids = self._keys, self._ids
+            pos = bisect_left(keys, prefix)
+            while pos < len(keys) and len(results) < limit and keys[pos].startswith(prefix):
+                id = ids[pos]
+                if id not in seen:
+                    seen.add(id)
+                    results.append((id, self._labels.get(id)))
+                pos += 1
+        return results
+
+
+def _product_entry(product):
+    return product.id, (product.sku, product.name), f'{product.sku} - {product.name}'
+
+
+def _customer_entry(customer):
+    full_name = f'{customer.first_name} {customer.last_name}'
+    return customer.id, (customer.email, customer.first_name, customer.last_name, full_name), f'{full_name} <{customer.email}>'
+
+
+def _category_entry(category):
+    return category.id, (category.name,), category.name
+
+
+class Autocomplete:
+    """Índices de prefixo em memória por tipo (produto, cliente, categoria).
+
+    Cada worker constrói o índice de um tipo na primeira consulta e, a cada
+    consulta seguinte, aplica apenas as linhas alteradas desde então, lidas
+    do ChangeLog com um cursor em memória. Assim as alterações feitas em
+    qualquer worker (ou em lote) chegam a todos sem reconstruir o índice.
+    """
+
+    def __init__(self):
+        self._indexes = {}
+        self._consumers = {}
+        self._lock = threading.Lock()
+        self._sources = {}
+
+    def register(self, type, model, entry):
+        self._sources[type] = (model, entry)
+
+    def register_defaults(self):
+        from app.models import Product, Customer, Category
+        self.register('product', Product, _product_entry)
+        self.register('customer', Customer, _customer_entry)
+        self.register('category', Category, _category_entry)
+
+    @property
+    def types(self):
+        return tuple(self._sources)
+
+    def index(self, type):
+        from app import changelog
+        index = self._indexes.get(type)
+        if index is None:
+            with self._lock:
+                index = self._indexes.get(type)
+                if index is None:
+                    model, entry = self._sources[type]
+                    session = model.query.session
+                    # A posição do log é lida antes da carga: nada se perde entre as duas
+                    start = changelog.last_seq(session)
+                    index = PrefixIndex()
+                    index.load(entry(row) for row in model.query.yield_per(1000))
+                    self._consumers[type] = changelog.Consumer(
+                        session, f'autocomplete:{type}', tables=[model.__tablename__],
+                        persistent=False, start=start,
+                    )
+                    self._indexes[type] = index
+                    return index
+        self.sync(type)
+        return index
+
+    def sync(self, type):
+        """Aplica ao índice as alterações registradas no ChangeLog desde a última consulta."""
+        from app import changelog
+        model, entry = self._sources[type]
+        index = self._indexes[type]
+        consumer = self._consumers[type]
+        for batch in consumer.batches():
+            upserted, deleted = changelog.changed_ids(batch).get(model.__tablename__, (set(), set()))
+            found = set()
+            if upserted:
+                for row in model.query.filter(model.id.in_(upserted)):
+                    index.add(*entry(row))
+                    found.add(row.id)
+            for id in deleted | (upserted - found):
+                index.remove(id)
+
+    def search(self, type, prefix, limit=10):
+        return self.index(type).search(prefix, limit)
+
+    def reset(self):
+        with self._lock:
+            self._indexes.clear()
+            self._consumers.clear()
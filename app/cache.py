@@ -0,0 +1,192 @@
+# app/cache.py
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from types import SimpleNamespace
+
+from flask import abort
+
+
+class Snapshot(SimpleNamespace):
+    """Cópia somente leitura das colunas de uma linha do banco."""
+
+
+def serialize(row):
+    """Converte uma instância de modelo em um dicionário com os valores das colunas."""
+    mapper = row.__mapper__
+    return {attr.key: getattr(row, attr.key) for attr in mapper.column_attrs}
+
+
+class _DiskTier:
+    """Camada opcional em um arquivo SQLite local, compartilhada entre os workers."""
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        conn = self._connect()
+        conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS versions (
+                model TEXT NOT NULL,
+                id INTEGER NOT NULL,
+                version INTEGER NOT NULL,
+                PRIMARY KEY (model, id)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS snapshots (
+                model TEXT NOT NULL,
+                id INTEGER NOT NULL,
+                version INTEGER NOT NULL,
+                expires REAL NOT NULL,
+                payload BLOB NOT NULL,
+                PRIMARY KEY (model, id, version)
+            ) WITHOUT ROWID;
+            """
+        )
+
+    def _connect(self):
+        # Uma conexão por thread e por processo (os workers são criados com fork)
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def version(self, model, id):
+        row = self._connect().execute(
+            'SELECT version FROM versions WHERE model = ? AND id = ?', (model, id)
+        ).fetchone()
+        return row[0] if row else 0
+
+    def get(self, model, id, version, now):
+        row = self._connect().execute(
+            'SELECT payload, expires FROM snapshots WHERE model = ? AND id = ? AND version = ? AND expires > ?',
+            (model, id, version, now),
+        ).fetchone()
+        return row if row else (None, None)
+
+    def put(self, model, id, version, payload, expires):
+        self._connect().execute(
+            'INSERT OR REPLACE INTO snapshots (model, id, version, expires, payload) VALUES (?, ?, ?, ?, ?)',
+            (model, id, version, expires, payload),
+        )
+
+    def bump(self, model, id):
+        conn = self._connect()
+        with conn:
+            conn.execute('BEGIN IMMEDIATE')
+            conn.execute(
+                'INSERT INTO versions (model, id, version) VALUES (?, ?, 1) '
+                'ON CONFLICT (model, id) DO UPDATE SET version = version + 1',
+                (model, id),
+            )
+            conn.execute('DELETE FROM snapshots WHERE model = ? AND id = ?', (model, id))
+
+
+class ObjectCache:
+    """Cache read-through de snapshots de linhas, com chave (modelo, id, versão).
+
+    Mantém um LRU em memória limitado pelo tamanho (em bytes) dos snapshots
+    serializados e uma camada em disco compartilhada entre os workers, onde
+    ficam as versões: um `invalidate` em qualquer processo (inclusive nos
+    comandos `flask`) vale para todos. Sem a camada em disco as versões ficam
+    só no processo. As rotas de escrita devem chamar `invalidate` após o
+    commit; o `ttl` limita a vida de um snapshot alterado por outro caminho.
+    """
+
+    def __init__(self, app=None, max_bytes=8 * 1024 * 1024, path=None, ttl=300):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._size = 0
+        self._versions = {}
+        self._lock = threading.Lock()
+        self._disk = _DiskTier(path) if path else None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.max_bytes = app.config.get('OBJECT_CACHE_MAX_BYTES', self.max_bytes)
+        self.ttl = app.config.get('OBJECT_CACHE_TTL', self.ttl)
+        path = app.config.get('OBJECT_CACHE_PATH')
+        if path:
+            self._disk = _DiskTier(path)
+        app.extensions['object_cache'] = self
+
+    def _version(self, model, id):
+        if self._disk is not None:
+            return self._disk.version(model, id)
+        return self._versions.get((model, id), 0)
+
+    def _remember(self, key, payload, expires):
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(old[0])
+            if len(payload) > self.max_bytes:
+                return
+            self._entries[key] = (payload, expires)
+            self._size += len(payload)
+            # Remove os menos usados até caber no limite
+            while self._size > self.max_bytes:
+                _, (evicted, _) = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def get(self, model, id):
+        """Retorna o snapshot em cache ou carrega a linha do banco. None se não existir."""
+        name = model.__name__
+        version = self._version(name, id)
+        key = (name, id, version)
+        now = time.time()
+
+        payload = None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] > now:
+                payload = entry[0]
+                self._entries.move_to_end(key)
+
+        if payload is None and self._disk is not None:
+            payload, expires = self._disk.get(name, id, version, now)
+            if payload is not None:
+                self._remember(key, payload, expires)
+
+        if payload is None:
+            row = model.query.session.get(model, id)
+            if row is None:
+                return None
+            payload = pickle.dumps(serialize(row), pickle.HIGHEST_PROTOCOL)
+            expires = now + self.ttl
+            self._remember(key, payload, expires)
+            if self._disk is not None:
+                self._disk.put(name, id, version, payload, expires)
+
+        return Snapshot(**pickle.loads(payload))
+
+    def get_or_404(self, model, id):
+        snapshot = self.get(model, id)
+        if snapshot is None:
+            abort(404)
+        return snapshot
+
+    def invalidate(self, model, id):
+        """Descarta o snapshot de uma linha; deve ser chamado depois de gravar alterações."""
+        name = model.__name__
+        version = self._version(name, id)
+        if self._disk is not None:
+            self._disk.bump(name, id)
+        with self._lock:
+            self._versions[(name, id)] = self._versions.get((name, id), 0) + 1
+            entry = self._entries.pop((name, id, version), None)
+            if entry is not None:
+                self._size -= len(entry[0])
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
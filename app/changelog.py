@@ -0,0 +1,145 @@
+# app/changelog.py
+# Log append-only das alterações, lido de forma incremental pelos consumidores.
+#
+# Requisito: SQLite. Os consumidores assumem que as entradas ficam visíveis na
+# ordem do `seq`, o que só vale porque o SQLite serializa as escritas. Num banco
+# com transações concorrentes (PostgreSQL, MySQL) um `seq` menor pode ser
+# confirmado depois de um maior e o cursor passaria por ele sem lê-lo.
+import warnings
+from datetime import datetime
+
+from sqlalchemy import event, func, select
+
+from app.models import ChangeLog, ChangeLogCursor, DailySales, DailySalesItem
+
+# Tabelas que não geram entradas: o próprio log, os cursores e os rollups
+# (dados derivados, recalculados a partir das tabelas registradas)
+IGNORED_TABLES = {
+    ChangeLog.__tablename__, ChangeLogCursor.__tablename__,
+    DailySales.__tablename__, DailySalesItem.__tablename__,
+}
+
+
+def _entry(instance, op):
+    """Entrada do log para a linha; só tabelas com chave primária inteira de uma coluna são registradas."""
+    table = instance.__table__
+    if table.name in IGNORED_TABLES:
+        return None
+    key = instance.__mapper__.primary_key_from_instance(instance)
+    if len(key) != 1 or not isinstance(key[0], int):
+        return None
+    return {'table_name': table.name, 'row_id': key[0], 'op': op, 'changed_at': datetime.utcnow()}
+
+
+def _record_flush(session, flush_context):
+    """after_flush: grava uma entrada por linha inserida, alterada ou removida."""
+    entries = [_entry(obj, 'insert') for obj in session.new]
+    entries += [_entry(obj, 'update') for obj in session.dirty if session.is_modified(obj, include_collections=False)]
+    entries += [_entry(obj, 'delete') for obj in session.deleted]
+    entries = [entry for entry in entries if entry is not None]
+    if entries:
+        session.connection().execute(ChangeLog.__table__.insert(), entries)
+
+
+def register(session):
+    """Liga o registro automático às sessões (chamado uma vez em create_app)."""
+    if not event.contains(session, 'after_flush', _record_flush):
+        event.listen(session, 'after_flush', _record_flush)
+
+
+def record(session, model, ids, op):
+    """Registro explícito para UPDATE/DELETE em lote, que não passam pelo flush.
+
+    Deve ser chamado antes do commit da mesma transação.
+    """
+    if not ids:
+        return
+    now = datetime.utcnow()
+    session.execute(ChangeLog.__table__.insert(), [
+        {'table_name': model.__tablename__, 'row_id': id, 'op': op, 'changed_at': now} for id in ids
+    ])
+
+
+def last_seq(session):
+    return session.execute(select(func.max(ChangeLog.seq))).scalar() or 0
+
+
+class Consumer:
+    """Lê o ChangeLog de forma incremental a partir de um cursor, em lotes.
+
+    Com `persistent=True` o cursor fica na tabela change_log_cursor (sobrevive a
+    reinícios e é compartilhado); caso contrário fica apenas em memória, o que
+    serve para índices que vivem dentro de cada worker.
+    """
+
+    def __init__(self, session, name, tables=None, batch_size=500, persistent=True, start=0):
+        self.session = session
+        self.name = name
+        self.tables = set(tables) if tables else None
+        self.batch_size = batch_size
+        self.persistent = persistent
+        self._position = None if persistent else start
+        if session.get_bind().dialect.name != 'sqlite':
+            warnings.warn('O ChangeLog só garante a ordem das entradas no SQLite; '
+                          'consumidores podem perder alterações neste banco.', RuntimeWarning)
+
+    @property
+    def position(self):
+        if self._position is None:
+            cursor = self.session.get(ChangeLogCursor, self.name)
+            self._position = cursor.last_seq if cursor else 0
+        return self._position
+
+    def read(self, limit=None, upto=None):
+        """Próximo lote (até `limit` entradas, com seq <= `upto`) depois do cursor, sem avançá-lo."""
+        statement = (
+            select(ChangeLog.seq, ChangeLog.table_name, ChangeLog.row_id, ChangeLog.op)
+            .where(ChangeLog.seq > self.position)
+            .order_by(ChangeLog.seq)
+            .limit(limit or self.batch_size)
+        )
+        if upto is not None:
+            statement = statement.where(ChangeLog.seq <= upto)
+        if self.tables is not None:
+            # Usa o índice (table_name, seq)
+            statement = statement.where(ChangeLog.table_name.in_(self.tables))
+        return self.session.execute(statement).all()
+
+    def commit(self, seq):
+        """Avança o cursor até `seq` (inclusive)."""
+        if self.persistent:
+            cursor = self.session.get(ChangeLogCursor, self.name)
+            if cursor is None:
+                cursor = ChangeLogCursor(consumer=self.name)
+                self.session.add(cursor)
+            cursor.last_seq = seq
+            self.session.commit()
+        self._position = seq
+
+    def batches(self):
+        """Itera lote a lote; o cursor avança depois que cada lote é processado.
+
+        Ao final o cursor vai até o fim do log lido no início, mesmo que as
+        últimas entradas sejam de outras tabelas: elas não são varridas de novo.
+        """
+        head = last_seq(self.session)
+        while True:
+            batch = self.read(upto=head)
+            if not batch:
+                if head > self.position:
+                    self.commit(head)
+                return
+            yield batch
+            self.commit(batch[-1].seq)
+
+
+def changed_ids(batch):
+    """Agrupa um lote em {tabela: (ids alterados/inseridos, ids removidos)} com o último estado de cada linha."""
+    latest = {}
+    for entry in batch:
+        latest[(entry.table_name, entry.row_id)] = entry.op
+    result = {}
+    for (table_name, row_id), op in latest.items():
+        upserted, deleted = result.setdefault(table_name, (set(), set()))
+        (deleted if op == 'delete' else upserted).add(row_id)
+    return result
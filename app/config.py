@@ -14,4 +14,28 @@ class Config:
         'sqlite:///' + os.path.join(basedir, 'app.db')
 
     # Desativa um recurso do SQLAlchemy que não usaremos e que emite avisos.
-    SQLALCHEMY_TRACK_MODIFICATIONS = False
\ No newline at end of file
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+
+    # Cache de snapshots das linhas (LRU em memória, limitado em bytes).
+    OBJECT_CACHE_MAX_BYTES = int(os.environ.get('OBJECT_CACHE_MAX_BYTES') or 8 * 1024 * 1024)
+    # Arquivo SQLite compartilhado entre os workers e os comandos `flask`, onde ficam
+    # as versões invalidadas (OBJECT_CACHE_PATH= vazio deixa o cache só no processo).
+    OBJECT_CACHE_PATH = os.environ.get('OBJECT_CACHE_PATH', os.path.join(basedir, 'object_cache.db'))
+    # Validade máxima (segundos) de um snapshot, para escritas que não chamam invalidate.
+    OBJECT_CACHE_TTL = int(os.environ.get('OBJECT_CACHE_TTL') or 300)
+
+    # Intervalo (segundos) do timer que expira cupons dentro do servidor (run.py); 0 desativa.
+    COUPON_SWEEP_INTERVAL = int(os.environ.get('COUPON_SWEEP_INTERVAL') or 0)
+
+    # Imagens dos produtos (armazenadas pelo hash do conteúdo) e miniaturas.
+    MEDIA_ROOT = os.environ.get('MEDIA_ROOT') or os.path.join(basedir, 'media')
+    MEDIA_THUMBNAIL_SIZE = 256
+    MAX_CONTENT_LENGTH = 16 * 1024 * 1024
+    # Com um proxy (nginx) na frente, deixa o envio dos arquivos para ele.
+    USE_X_SENDFILE = bool(os.environ.get('USE_X_SENDFILE'))
+
+    # Limite de tentativas de login/cadastro (buckets num SQLite local compartilhado pelos workers).
+    RATELIMIT_ENABLED = os.environ.get('RATELIMIT_ENABLED', '1') != '0'
+    RATELIMIT_PATH = os.environ.get('RATELIMIT_PATH') or os.path.join(basedir, 'ratelimit.db')
+    # Número de proxies (nginx etc.) na frente da aplicação; com 0 o IP vem direto da conexão.
+    PROXY_COUNT = int(os.environ.get('PROXY_COUNT') or 0)
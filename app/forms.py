@@ -1,12 +1,20 @@
 from flask_wtf import FlaskForm
-from wtforms import StringField, TextAreaField, FloatField, SubmitField, SelectField
-from wtforms import StringField, PasswordField, SubmitField
-from wtforms.validators import DataRequired, Length
-from wtforms.validators import DataRequired, Email, EqualTo, ValidationError
-from app.models import User
+from flask_wtf.file import FileField, FileAllowed
+from wtforms import (StringField, TextAreaField, FloatField, IntegerField, SelectField, DateField,
+                     BooleanField, PasswordField, SubmitField)
+from wtforms.validators import DataRequired, Email, EqualTo, Length, NumberRange, Optional
+from sqlalchemy import or_
+from app.models import User, Category
+
+class LoginForm(FlaskForm):
+    username = StringField('Usuário', validators=[DataRequired()])
+    password = PasswordField('Senha', validators=[DataRequired()])
+    submit = SubmitField('Entrar')
 
 class CategoryForm(FlaskForm):
+    """Formulário para criar/editar Categorias."""
     name = StringField('Nome da Categoria', validators=[DataRequired(), Length(min=3, max=100)])
+    description = TextAreaField('Descrição', validators=[Optional(), Length(max=500)])
     submit = SubmitField('Salvar Categoria')
 
 class AnnouncementForm(FlaskForm):
@@ -14,10 +22,48 @@ class AnnouncementForm(FlaskForm):
     description = TextAreaField('Descrição')
     price = FloatField('Preço', validators=[DataRequired()])
 
-    # O campo de categoria 
+    # O campo de categoria
     category = SelectField('Categoria', coerce=int, validators=[DataRequired()])
     submit = SubmitField('Salvar Anúncio')
-    
+
+class ProductForm(FlaskForm):
+    """Formulário para criar/editar Produtos."""
+    name = StringField('Nome do Produto', validators=[DataRequired(), Length(max=120)])
+    description = TextAreaField('Descrição', validators=[DataRequired()])
+    price = FloatField('Preço', validators=[DataRequired(), NumberRange(min=0)])
+    stock = IntegerField('Estoque', validators=[DataRequired(), NumberRange(min=0)])
+    sku = StringField('SKU (Código)', validators=[DataRequired(), Length(max=50)])
+    origin = StringField('Origem', validators=[Optional(), Length(max=100)])
+    spiciness_level = SelectField('Nível de Picância', choices=[(0, 'N/A')] + [(i, str(i)) for i in range(1, 6)], coerce=int, validators=[Optional()])
+    category_id = SelectField('Categoria', coerce=int, validators=[DataRequired()])
+    image = FileField('Imagem', validators=[FileAllowed(['jpg', 'jpeg', 'png', 'gif', 'webp'], 'Apenas imagens.')])
+
+    def __init__(self, *args, **kwargs):
+        super(ProductForm, self).__init__(*args, **kwargs)
+        self.category_id.choices = [(c.id, c.name) for c in Category.query.order_by('name').all()]
+
+class CustomerForm(FlaskForm):
+    """Formulário para criar/editar Clientes."""
+    first_name = StringField('Nome', validators=[DataRequired(), Length(max=100)])
+    last_name = StringField('Sobrenome', validators=[DataRequired(), Length(max=100)])
+    email = StringField('Email', validators=[DataRequired(), Length(max=120)])
+    phone = StringField('Telefone', validators=[Optional(), Length(max=20)])
+    address = StringField('Endereço', validators=[Optional(), Length(max=255)])
+    city = StringField('Cidade', validators=[Optional(), Length(max=100)])
+    state = StringField('Estado', validators=[Optional(), Length(max=50)])
+    zip_code = StringField('CEP', validators=[Optional(), Length(max=20)])
+
+class BulkActionForm(FlaskForm):
+    """Formulário das ações em massa das listas do painel (só o token CSRF; os ids e a ação vêm da lista)."""
+
+class CouponForm(FlaskForm):
+    """Formulário para criar/editar Cupons."""
+    code = StringField('Código do Cupom', validators=[DataRequired(), Length(max=50)])
+    discount_type = SelectField('Tipo de Desconto', choices=[('percentage', 'Percentual (%)'), ('fixed', 'Valor Fixo (R$)')], validators=[DataRequired()])
+    value = FloatField('Valor', validators=[DataRequired(), NumberRange(min=0)])
+    expiration_date = DateField('Data de Expiração', format='%Y-%m-%d', validators=[Optional()])
+    is_active = BooleanField('Ativo', default=True)
+
 class RegistrationForm(FlaskForm):
     username = StringField('Nome de Utilizador', validators=[DataRequired()])
     email = StringField('Email', validators=[DataRequired(), Email()])
@@ -26,13 +72,40 @@ class RegistrationForm(FlaskForm):
         'Repetir Senha', validators=[DataRequired(), EqualTo('password', message='As senhas devem ser iguais.')])
     submit = SubmitField('Registar')
 
-    # Funções que verificam se o username e o email já existem na base de dados
-    def validate_username(self, username):
-        user = User.query.filter_by(username=username.data).first()
-        if user is not None:
-            raise ValidationError('Este nome de utilizador já existe. Por favor, escolha outro.')
+    # A unicidade não é verificada aqui: a view insere direto e, se o banco
+    # recusar, `unique_violation` e `check_taken` põem o erro nos campos certos.
+    TAKEN_MESSAGES = {
+        'username': 'Este nome de utilizador já existe. Por favor, escolha outro.',
+        'email': 'Este email já está a ser utilizado. Por favor, escolha outro.',
+    }
+
+    def unique_violation(self, error):
+        """Marca os campos cuja restrição UNIQUE foi violada no IntegrityError.
+
+        Reconhece o nome da restrição (MySQL/PostgreSQL: 'uq_user_email') e a
+        coluna (SQLite: 'UNIQUE constraint failed: user.email'). Retorna False
+        se a mensagem não indicar nenhuma das duas colunas.
+        """
+        message = str(error.orig)
+        fields = [field for field in self.TAKEN_MESSAGES
+                  if f'uq_user_{field}' in message or f'user.{field}' in message]
+        for field in fields:
+            self._mark_taken(field)
+        return bool(fields)
+
+    def check_taken(self):
+        """Consulta única (username OU email, ambos indexados) para marcar os campos já usados."""
+        username, email = self.username.data, self.email.data
+        taken = User.query.filter(or_(User.username == username, User.email == email)) \
+            .with_entities(User.username, User.email).all()
+        for row in taken:
+            if row.username == username:
+                self._mark_taken('username')
+            if row.email == email:
+                self._mark_taken('email')
+        return bool(taken)
 
-    def validate_email(self, email):
-        user = User.query.filter_by(email=email.data).first()
-        if user is not None:
-            raise ValidationError('Este email já está a ser utilizado. Por favor, escolha outro.')
\ No newline at end of file
+    def _mark_taken(self, field):
+        errors = self[field].errors
+        if self.TAKEN_MESSAGES[field] not in errors:
+            errors.append(self.TAKEN_MESSAGES[field])
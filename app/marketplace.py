@@ -0,0 +1,211 @@
+# app/marketplace.py
+# Marketplace: página inicial, anúncios, categorias e páginas públicas de produto.
+
+import os
+
+from flask import Blueprint, render_template, flash, redirect, url_for, request, send_file, abort, make_response
+from flask_login import login_required
+
+from app import db, object_cache, media_store, storefront
+from app.media import HASH_RE
+from app.models import Category, Announcement, Product
+
+# Os formulários (WTForms) são importados dentro das views, só quando usados
+bp = Blueprint('marketplace', __name__)
+
+
+# --- Rotas Principais e Protegidas ---
+
+@bp.route('/')
+@bp.route('/index')
+@login_required # Protege a página inicial
+def index():
+    return render_template('index.html')
+
+# --- ROTAS DE CATEGORIA (CRUD) ---
+
+@bp.route('/categorias')
+@login_required # Protege a rota
+def list_categories():
+    categories = Category.query.all()
+    return render_template('category/list.html', categories=categories) # Supondo que o seu HTML está em templates/category/list.html
+
+@bp.route('/categorias/nova', methods=['GET', 'POST'])
+@login_required # Protege a rota
+def create_category():
+    from app.forms import CategoryForm
+    form = CategoryForm()
+    if form.validate_on_submit():
+        new_category = Category(name=form.name.data)
+        db.session.add(new_category)
+        db.session.commit()
+        flash('Categoria criada com sucesso!', 'success')
+        return redirect(url_for('.list_categories'))
+    return render_template('category/create_edit.html', form=form, title='Nova Categoria')
+
+@bp.route('/categorias/editar/<int:id>', methods=['GET', 'POST'])
+@login_required # Protege a rota
+def edit_category(id):
+    from app.forms import CategoryForm
+    form = CategoryForm(obj=object_cache.get_or_404(Category, id))
+    if form.validate_on_submit():
+        category = Category.query.get_or_404(id)
+        category.name = form.name.data
+        db.session.commit()
+        object_cache.invalidate(Category, id)
+        flash('Categoria atualizada com sucesso!', 'success')
+        return redirect(url_for('.list_categories'))
+    return render_template('category/create_edit.html', form=form, title='Editar Categoria')
+
+@bp.route('/categorias/deletar/<int:id>', methods=['POST'])
+@login_required # Protege a rota
+def delete_category(id):
+    category = Category.query.get_or_404(id)
+    if category.announcements.count() > 0:
+        flash('Não é possível excluir uma categoria que possui anúncios vinculados.', 'danger')
+        return redirect(url_for('.list_categories'))
+    
+    product_ids = [p.id for p in category.products]
+    db.session.delete(category)
+    db.session.commit()
+    object_cache.invalidate(Category, id)
+    # Os produtos da categoria são removidos em cascata
+    for product_id in product_ids:
+        object_cache.invalidate(Product, product_id)
+    flash('Categoria excluída com sucesso!', 'success')
+    return redirect(url_for('.list_categories'))
+
+
+# --- ROTAS DE ANÚNCIO (CRUD) ---
+
+@bp.route('/anuncios')
+@login_required # Protege a rota
+def list_announcements():
+    # ?sort=newest|cheapest e ?categoria=<id> usam os índices da vitrine
+    sort = request.args.get('sort')
+    if sort in storefront.ORDERINGS:
+        announcements = storefront.top(
+            Announcement, sort,
+            limit=storefront.clamp_limit(request.args.get('limit', type=int)),
+            category_id=request.args.get('categoria', type=int),
+        )
+    else:
+        announcements = Announcement.query.all()
+    return render_template('announcement/list.html', announcements=announcements)
+
+@bp.route('/anuncios/novo', methods=['GET', 'POST'])
+@login_required # Protege a rota
+def create_announcement():
+    from app.forms import AnnouncementForm
+    form = AnnouncementForm()
+    form.category.choices = [(c.id, c.name) for c in Category.query.order_by('name').all()]
+    
+    if form.validate_on_submit():
+        new_announcement = Announcement(
+            title=form.title.data,
+            description=form.description.data,
+            price=form.price.data,
+            category_id=form.category.data
+        )
+        db.session.add(new_announcement)
+        db.session.commit()
+        flash('Anúncio criado com sucesso!', 'success')
+        return redirect(url_for('.list_announcements'))
+        
+    return render_template('announcement/create_edit.html', form=form, title='Novo Anúncio')
+
+@bp.route('/anuncios/editar/<int:id>', methods=['GET', 'POST'])
+@login_required # Protege a rota
+def edit_announcement(id):
+    announcement = object_cache.get_or_404(Announcement, id)
+    from app.forms import AnnouncementForm
+    form = AnnouncementForm(obj=announcement)
+    form.category.choices = [(c.id, c.name) for c in Category.query.order_by('name').all()]
+    
+    if form.validate_on_submit():
+        announcement = Announcement.query.get_or_404(id)
+        announcement.title = form.title.data
+        announcement.description = form.description.data
+        announcement.price = form.price.data
+        announcement.category_id = form.category.data
+        db.session.commit()
+        object_cache.invalidate(Announcement, id)
+        flash('Anúncio atualizado com sucesso!', 'success')
+        return redirect(url_for('.list_announcements'))
+    
+    # ..categoria correta esteja selecionada ao carregar
+    form.category.data = announcement.category_id
+    return render_template('announcement/create_edit.html', form=form, title='Editar Anúncio')
+
+@bp.route('/anuncios/deletar/<int:id>', methods=['POST'])
+@login_required # Protege a rota
+def delete_announcement(id):
+    announcement = Announcement.query.get_or_404(id)
+    db.session.delete(announcement)
+    db.session.commit()
+    object_cache.invalidate(Announcement, id)
+    flash('Anúncio excluído com sucesso!', 'success')
+    return redirect(url_for('.list_announcements'))
+
+
+# --- Vitrine Pública ---
+
+@bp.route('/produto/<int:id>')
+def product_detail(id):
+    """Página pública de detalhe do produto, servida a partir do cache."""
+    product = object_cache.get_or_404(Product, id)
+    category = object_cache.get(Category, product.category_id)
+    return render_template('product_detail.html', title=product.name, product=product, category=category)
+
+@bp.route('/vitrine')
+def storefront_page():
+    """Os melhores produtos de cada categoria (?sort=cheapest|newest), pelos índices compostos."""
+    sort = request.args.get('sort', 'cheapest')
+    if sort not in storefront.ORDERINGS:
+        sort = 'cheapest'
+    categories = Category.query.order_by(Category.name).all()
+    best = storefront.top_per_category(Product, [c.id for c in categories], sort, limit=5)
+    return render_template('vitrine.html', title='Vitrine', sort=sort,
+                           sections=[(category, best[category.id]) for category in categories if best[category.id]])
+
+# --- Imagens ---
+# O conteúdo de uma URL de mídia nunca muda (a chave é o hash), então pode ficar
+# em cache no navegador indefinidamente.
+MEDIA_MAX_AGE = 365 * 24 * 60 * 60
+
+# Exibido nas listas enquanto a miniatura não existe (nunca o original inteiro)
+THUMBNAIL_PLACEHOLDER = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="64" height="64" viewBox="0 0 64 64">'
+    '<rect width="64" height="64" fill="#e5e7eb"/></svg>'
+)
+
+def send_media(path, mimetype):
+    response = send_file(path, mimetype=mimetype, max_age=MEDIA_MAX_AGE, conditional=True)
+    response.cache_control.public = True
+    response.cache_control.immutable = True
+    return response
+
+@bp.route('/media/<hash>')
+def product_image(hash):
+    if not HASH_RE.match(hash):
+        abort(404)
+    path = media_store.original_path(hash)
+    if not os.path.exists(path):
+        abort(404)
+    return send_media(path, media_store.content_type(hash))
+
+@bp.route('/media/<hash>/thumb')
+def product_thumbnail(hash):
+    if not HASH_RE.match(hash):
+        abort(404)
+    path = media_store.thumbnail_path(hash)
+    if os.path.exists(path):
+        return send_media(path, 'image/jpeg')
+    if not os.path.exists(media_store.original_path(hash)):
+        abort(404)
+    # Miniatura ainda não gerada: agenda e responde um placeholder de cache curto
+    media_store.schedule_thumbnail(hash)
+    response = make_response(THUMBNAIL_PLACEHOLDER)
+    response.mimetype = 'image/svg+xml'
+    response.cache_control.max_age = 10
+    return response
@@ -0,0 +1,171 @@
+# app/media.py
+import hashlib
+import importlib.util
+import os
+import re
+import tempfile
+import threading
+from functools import lru_cache
+
+# Pillow é opcional: sem ele as miniaturas não são geradas. Só é importado
+# dentro dos processos do pool, nunca no arranque dos workers.
+HAS_PILLOW = importlib.util.find_spec('PIL') is not None
+
+HASH_RE = re.compile(r'^[0-9a-f]{64}$')
+CHUNK_SIZE = 64 * 1024
+
+# Assinaturas (primeiros bytes) dos formatos aceitos no upload
+SIGNATURES = [
+    (b'\xff\xd8\xff', 'image/jpeg'),
+    (b'\x89PNG\r\n\x1a\n', 'image/png'),
+    (b'GIF87a', 'image/gif'),
+    (b'GIF89a', 'image/gif'),
+]
+
+
+def sniff(header):
+    """Content-Type da imagem pelos primeiros bytes, ou None se o formato não for aceito."""
+    if header[:4] == b'RIFF' and header[8:12] == b'WEBP':
+        return 'image/webp'
+    for signature, content_type in SIGNATURES:
+        if header.startswith(signature):
+            return content_type
+    return None
+
+
+def make_thumbnail(source, target, size):
+    """Gera a miniatura em um processo do pool (fora do ciclo da requisição)."""
+    from PIL import Image
+
+    tmp = f'{target}.{os.getpid()}.tmp'
+    try:
+        with Image.open(source) as image:
+            image.thumbnail((size, size))
+            if image.mode not in ('RGB', 'L'):
+                image = image.convert('RGB')
+            image.save(tmp, 'JPEG', quality=82, optimize=True)
+        os.replace(tmp, target)
+    finally:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+    return target
+
+
+class MediaStore:
+    """Armazenamento de imagens endereçado pelo conteúdo (SHA-256).
+
+    Arquivos iguais são gravados uma única vez em `<root>/<aa>/<hash>` e as
+    miniaturas ficam ao lado, em `<hash>.thumb.jpg`. O upload só é aceito se
+    os primeiros bytes forem de um formato de imagem conhecido.
+    """
+
+    def __init__(self, app=None, root=None, thumbnail_size=256, workers=2):
+        self.root = root
+        self.thumbnail_size = thumbnail_size
+        self.workers = workers
+        self.logger = None
+        self._pool = None
+        self._pool_pid = None
+        self._pending = {}   # hash -> Future da miniatura em geração
+        self._failed = set()  # hashes cuja miniatura falhou (não são reenviados)
+        self._lock = threading.RLock()  # O callback pode rodar na própria thread que submeteu
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.root = app.config.get('MEDIA_ROOT', self.root)
+        self.thumbnail_size = app.config.get('MEDIA_THUMBNAIL_SIZE', self.thumbnail_size)
+        self.workers = app.config.get('MEDIA_THUMBNAIL_WORKERS', self.workers)
+        self.logger = app.logger
+        app.extensions['media_store'] = self
+
+    def _pool_for_process(self):
+        # O pool é criado sob demanda em cada worker (não sobrevive a um fork)
+        if self._pool is None or self._pool_pid != os.getpid():
+            from concurrent.futures import ProcessPoolExecutor
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+            self._pool_pid = os.getpid()
+            self._pending = {}
+        return self._pool
+
+    def original_path(self, digest):
+        return os.path.join(self.root, digest[:2], digest)
+
+    def thumbnail_path(self, digest):
+        return self.original_path(digest) + '.thumb.jpg'
+
+    def content_type(self, digest):
+        return _content_type(self.original_path(digest))
+
+    def save(self, stream):
+        """Grava o upload (um FileStorage ou arquivo binário) e retorna o hash do conteúdo.
+
+        Levanta ValueError se o conteúdo não for uma imagem JPEG, PNG, GIF ou WebP.
+        """
+        first = stream.read(CHUNK_SIZE)
+        if sniff(first) is None:
+            raise ValueError('Formato de imagem não suportado.')
+        os.makedirs(self.root, exist_ok=True)
+        sha = hashlib.sha256()
+        fd, tmp = tempfile.mkstemp(dir=self.root, suffix='.upload')
+        try:
+            with os.fdopen(fd, 'wb') as out:
+                sha.update(first)
+                out.write(first)
+                for chunk in iter(lambda: stream.read(CHUNK_SIZE), b''):
+                    sha.update(chunk)
+                    out.write(chunk)
+            digest = sha.hexdigest()
+            target = self.original_path(digest)
+            if os.path.exists(target):
+                os.unlink(tmp)  # Conteúdo já armazenado: deduplica
+            else:
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                os.replace(tmp, target)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+
+        self.schedule_thumbnail(digest)
+        return digest
+
+    def schedule_thumbnail(self, digest):
+        """Agenda a geração da miniatura no pool de processos, se ainda não existir.
+
+        Uma miniatura já em geração não é reenviada, e uma que falhou não é
+        tentada de novo neste processo.
+        """
+        if not HAS_PILLOW or digest in self._failed or os.path.exists(self.thumbnail_path(digest)):
+            return None
+        with self._lock:
+            pool = self._pool_for_process()
+            future = self._pending.get(digest)
+            if future is None:
+                future = pool.submit(
+                    make_thumbnail, self.original_path(digest), self.thumbnail_path(digest), self.thumbnail_size
+                )
+                self._pending[digest] = future
+                future.add_done_callback(lambda done: self._thumbnail_done(digest, done))
+        return future
+
+    def _thumbnail_done(self, digest, future):
+        with self._lock:
+            self._pending.pop(digest, None)
+        error = future.exception() if not future.cancelled() else None
+        if error is not None:
+            self._failed.add(digest)
+            if self.logger is not None:
+                self.logger.error('Falha ao gerar a miniatura de %s: %r', digest, error)
+
+    def shutdown(self):
+        if self._pool is not None and self._pool_pid == os.getpid():
+            self._pool.shutdown(wait=True)
+        self._pool = None
+
+
+@lru_cache(maxsize=4096)
+def _content_type(path):
+    # O conteúdo de um hash nunca muda: basta ler o cabeçalho uma vez por processo
+    with open(path, 'rb') as source:
+        return sniff(source.read(16)) or 'application/octet-stream'
@@ -1,4 +1,9 @@
 # app/models.py
+# Registro único de modelos da aplicação (painel administrativo e marketplace).
+
+from datetime import datetime
+
+from sqlalchemy import select
 
 from app import db, login_manager # Importa db e login_manager do __init__.py
 from flask_login import UserMixin
@@ -7,28 +12,22 @@ from werkzeug.security import generate_password_hash, check_password_hash
 # Esta função diz ao Flask-Login como encontrar um utilizador
 @login_manager.user_loader
 def load_user(user_id):
-    return User.query.get(int(user_id))
+    return db.session.get(User, int(user_id))
 
 
 # --- Suas Classes de Modelo ---
 
 class User(UserMixin, db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    username = db.Column(db.String(80), unique=True, nullable=False)
-    email = db.Column(db.String(120), unique=True, nullable=False)
+    username = db.Column(db.String(80), nullable=False)
+    email = db.Column(db.String(120), nullable=False)
     password_hash = db.Column(db.String(256))
 
-    def set_password(self, password):
-        self.password_hash = generate_password_hash(password)
-
-    def check_password(self, password):
-        return check_password_hash(self.password_hash, password)
-
-class User(UserMixin, db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    username = db.Column(db.String(80), unique=True, nullable=False)
-    email = db.Column(db.String(120), unique=True, nullable=False)
-    password_hash = db.Column(db.String(256))
+    # Restrições nomeadas: o cadastro identifica pelo nome qual delas foi violada
+    __table_args__ = (
+        db.UniqueConstraint('username', name='uq_user_username'),
+        db.UniqueConstraint('email', name='uq_user_email'),
+    )
 
     def set_password(self, password):
         self.password_hash = generate_password_hash(password)
@@ -37,25 +36,180 @@ class User(UserMixin, db.Model):
         return check_password_hash(self.password_hash, password)
 
 class Category(db.Model):
+    """Modelo para Categorias de Produtos e Anúncios."""
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False, unique=True)
+    description = db.Column(db.Text, nullable=True)
+    products = db.relationship('Product', backref='category', lazy=True, cascade="all, delete-orphan")
     announcements = db.relationship('Announcement', backref='category', lazy='dynamic')
 
     def __repr__(self):
         return f'<Category {self.name}>'
 
+class Product(db.Model):
+    """Modelo para Produtos (Temperos)."""
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(120), nullable=False)
+    description = db.Column(db.Text, nullable=False)
+    price = db.Column(db.Float, nullable=False, index=True)
+    stock = db.Column(db.Integer, nullable=False, default=0)
+    sku = db.Column(db.String(50), nullable=False, unique=True)
+    origin = db.Column(db.String(100), nullable=True)
+    spiciness_level = db.Column(db.Integer, nullable=True) # Escala de 1 a 5
+    category_id = db.Column(db.Integer, db.ForeignKey('category.id'), nullable=False)
+    created_at = db.Column(db.DateTime, index=True, default=datetime.utcnow)
+    image_hash = db.Column(db.String(64), nullable=True) # SHA-256 da imagem no MediaStore
+
+    # Índices compostos para "mais baratos" e "mais novos" por categoria
+    __table_args__ = (
+        db.Index('ix_product_category_price', 'category_id', 'price'),
+        db.Index('ix_product_category_created', 'category_id', 'created_at'),
+    )
+
+    def __repr__(self):
+        return f'<Product {self.name}>'
+
+class Customer(db.Model):
+    """Modelo para Clientes."""
+    id = db.Column(db.Integer, primary_key=True)
+    first_name = db.Column(db.String(100), nullable=False)
+    last_name = db.Column(db.String(100), nullable=False)
+    email = db.Column(db.String(120), unique=True, nullable=False)
+    phone = db.Column(db.String(20), nullable=True)
+    address = db.Column(db.String(255), nullable=True)
+    city = db.Column(db.String(100), nullable=True)
+    state = db.Column(db.String(50), nullable=True)
+    zip_code = db.Column(db.String(20), nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f'<Customer {self.first_name} {self.last_name}>'
+
+class Coupon(db.Model):
+    """Modelo para Cupons de Desconto."""
+    id = db.Column(db.Integer, primary_key=True)
+    code = db.Column(db.String(50), unique=True, nullable=False)
+    discount_type = db.Column(db.String(20), nullable=False, default='percentage') # 'percentage' or 'fixed'
+    value = db.Column(db.Float, nullable=False)
+    expiration_date = db.Column(db.Date, nullable=True)
+    is_active = db.Column(db.Boolean, default=True)
+
+    # Usado pelo sweeper de expiração e pelo filtro de cupons ativos
+    __table_args__ = (
+        db.Index('ix_coupon_active_expiration', 'is_active', 'expiration_date'),
+    )
+
+    def __repr__(self):
+        return f'<Coupon {self.code}>'
+
 class Announcement(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(120), nullable=False)
     description = db.Column(db.Text, nullable=True)
-    price = db.Column(db.Float, nullable=False)
+    price = db.Column(db.Float, nullable=False, index=True)
     created_at = db.Column(db.DateTime, index=True, default=datetime.utcnow)
-    
+
     # Chave estrangeira para a categoria
     category_id = db.Column(db.Integer, db.ForeignKey('category.id'), nullable=False)
-    
+
+    # Índices compostos para "mais baratos" e "mais novos" por categoria
+    __table_args__ = (
+        db.Index('ix_announcement_category_price', 'category_id', 'price'),
+        db.Index('ix_announcement_category_created', 'category_id', 'created_at'),
+    )
+
     # ..chave estrangeira para o usuário
     # user_id = db.Column(db.Integer, db.ForeignKey('user.id'))
 
     def __repr__(self):
-        return f'<Announcement {self.title}>'
\ No newline at end of file
+        return f'<Announcement {self.title}>'
+
+def _snapshot_of(column, key):
+    """Default de coluna que copia, no INSERT, o valor atual de `column` para o pedido.
+
+    `key` é a coluna do próprio INSERT com o id da linha de origem (ex.: product_id).
+    """
+    def default(context):
+        id = context.get_current_parameters().get(key)
+        return context.connection.execute(select(column).where(column.table.c.id == id)).scalar()
+    return default
+
+class Order(db.Model):
+    """Modelo para Pedidos."""
+    # 'order' é palavra reservada em SQL
+    __tablename__ = 'orders'
+    id = db.Column(db.Integer, primary_key=True)
+    customer_id = db.Column(db.Integer, db.ForeignKey('customer.id'), nullable=False, index=True)
+    status = db.Column(db.String(20), nullable=False, default='pending') # 'pending', 'paid', 'shipped' ou 'cancelled'
+    created_at = db.Column(db.DateTime, index=True, default=datetime.utcnow)
+    # Estado do cliente no momento da compra (os relatórios não mudam se o cadastro mudar)
+    state = db.Column(db.String(50), nullable=True, default=_snapshot_of(Customer.__table__.c.state, 'customer_id'))
+    items = db.relationship('OrderItem', backref='order', lazy=True, cascade="all, delete-orphan")
+    # Sem cascata: um cliente com pedidos não pode ser excluído (ver admin.delete_customer)
+    customer = db.relationship('Customer', backref=db.backref('orders', lazy='dynamic', passive_deletes='all'))
+
+    def __repr__(self):
+        return f'<Order {self.id}>'
+
+class OrderItem(db.Model):
+    """Item de um pedido (preço unitário congelado no momento da compra)."""
+    id = db.Column(db.Integer, primary_key=True)
+    order_id = db.Column(db.Integer, db.ForeignKey('orders.id'), nullable=False, index=True)
+    product_id = db.Column(db.Integer, db.ForeignKey('product.id'), nullable=False)
+    quantity = db.Column(db.Integer, nullable=False, default=1)
+    unit_price = db.Column(db.Float, nullable=False)
+    # Atributos do produto congelados no momento da compra, como o preço
+    category_id = db.Column(db.Integer, nullable=True, default=_snapshot_of(Product.__table__.c.category_id, 'product_id'))
+    origin = db.Column(db.String(100), nullable=True, default=_snapshot_of(Product.__table__.c.origin, 'product_id'))
+    spiciness_level = db.Column(db.Integer, nullable=True, default=_snapshot_of(Product.__table__.c.spiciness_level, 'product_id'))
+    product = db.relationship('Product')
+
+    def __repr__(self):
+        return f'<OrderItem {self.order_id}:{self.product_id}>'
+
+class DailySales(db.Model):
+    """Rollup diário de vendas: receita e unidades por dia, dimensão e valor (ver app/analytics.py)."""
+    __tablename__ = 'daily_sales'
+    id = db.Column(db.Integer, primary_key=True)
+    day = db.Column(db.Date, nullable=False)
+    dimension = db.Column(db.String(20), nullable=False) # 'category', 'state', 'origin' ou 'spiciness'
+    key = db.Column(db.String(100), nullable=False, default='') # Valor da dimensão (ex.: 'SP'); '' se vazio
+    revenue = db.Column(db.Float, nullable=False, default=0)
+    units = db.Column(db.Integer, nullable=False, default=0)
+
+    # Uma linha por dia, dimensão e valor (também atende o filtro por dimensão e período)
+    __table_args__ = (
+        db.UniqueConstraint('dimension', 'day', 'key', name='uq_daily_sales_dimension_day_key'),
+    )
+
+class DailySalesItem(db.Model):
+    """Dia em que cada item de pedido foi contado no rollup (para desfazer a contagem se ele mudar)."""
+    __tablename__ = 'daily_sales_item'
+    order_item_id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    order_id = db.Column(db.Integer, nullable=False, index=True)
+    day = db.Column(db.Date, nullable=False)
+
+class ChangeLog(db.Model):
+    """Registro append-only das alterações (gravado na mesma transação da alteração)."""
+    __tablename__ = 'change_log'
+    # AUTOINCREMENT no SQLite garante que um seq nunca é reutilizado; o índice
+    # (table_name, seq) atende os consumidores que filtram por tabela
+    __table_args__ = (
+        db.Index('ix_change_log_table_seq', 'table_name', 'seq'),
+        {'sqlite_autoincrement': True},
+    )
+
+    seq = db.Column(db.Integer, primary_key=True)
+    table_name = db.Column(db.String(64), nullable=False)
+    row_id = db.Column(db.Integer, nullable=False)
+    op = db.Column(db.String(6), nullable=False) # 'insert', 'update' ou 'delete'
+    changed_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f'<ChangeLog {self.seq} {self.op} {self.table_name}:{self.row_id}>'
+
+class ChangeLogCursor(db.Model):
+    """Última posição lida por cada consumidor persistente do ChangeLog."""
+    __tablename__ = 'change_log_cursor'
+    consumer = db.Column(db.String(64), primary_key=True)
+    last_seq = db.Column(db.Integer, nullable=False, default=0)
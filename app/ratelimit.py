@@ -0,0 +1,182 @@
+# app/ratelimit.py
+import math
+import os
+import sqlite3
+import threading
+import time
+from functools import wraps
+
+from flask import Response, request
+
+UNITS = {'second': 1, 'minute': 60, 'hour': 3600, 'day': 86400}
+PRUNE_EVERY = 1000  # Limpeza dos buckets cheios a cada N verificações (por processo)
+
+
+def parse_limit(limit):
+    """Converte '5/minute' em (capacidade, tokens por segundo)."""
+    count, _, unit = limit.partition('/')
+    count = int(count)
+    return count, count / UNITS[unit.strip().rstrip('s')]
+
+
+class _BucketStore:
+    """Buckets num arquivo SQLite local, compartilhado entre os workers.
+
+    Cada verificação é um único UPSERT ... RETURNING: a recarga, o consumo do
+    token e a decisão acontecem atomicamente dentro do SQLite, sem ida e volta.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        self._calls = 0
+        self._connect().execute(
+            """
+            CREATE TABLE IF NOT EXISTS buckets (
+                key TEXT PRIMARY KEY,
+                tokens REAL NOT NULL,
+                updated REAL NOT NULL,
+                blocked INTEGER NOT NULL,
+                capacity REAL NOT NULL,
+                rate REAL NOT NULL
+            ) WITHOUT ROWID
+            """
+        )
+
+    def _connect(self):
+        # Uma conexão por thread e por processo (os workers são criados com fork)
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=OFF')  # Perder buckets num crash é aceitável
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def take(self, key, capacity, rate, now=None):
+        """Consome um token do bucket. Retorna 0 se permitido, ou os segundos até o próximo token."""
+        now = time.time() if now is None else now
+        # As expressões do SET leem os valores antigos da linha
+        refill = 'min(:capacity, tokens + (:now - updated) * :rate)'
+        tokens, blocked = self._connect().execute(
+            f"""
+            INSERT INTO buckets (key, tokens, updated, blocked, capacity, rate)
+            VALUES (:key, :capacity - 1, :now, 0, :capacity, :rate)
+            ON CONFLICT (key) DO UPDATE SET
+                tokens = CASE WHEN {refill} >= 1 THEN {refill} - 1 ELSE {refill} END,
+                blocked = {refill} < 1,
+                updated = :now,
+                capacity = :capacity,
+                rate = :rate
+            RETURNING tokens, blocked
+            """,
+            {'key': key, 'capacity': capacity, 'rate': rate, 'now': now},
+        ).fetchone()
+
+        self._calls += 1
+        if self._calls % PRUNE_EVERY == 0:
+            self.prune(now)
+        return (1 - tokens) / rate if blocked else 0
+
+    def peek(self, key, now=None):
+        """Como `take`, mas sem consumir: 0 se houver ao menos um token."""
+        now = time.time() if now is None else now
+        row = self._connect().execute(
+            'SELECT min(capacity, tokens + (? - updated) * rate), rate FROM buckets WHERE key = ?', (now, key)
+        ).fetchone()
+        if row is None or row[0] >= 1:
+            return 0
+        return (1 - row[0]) / row[1]
+
+    def prune(self, now=None):
+        """Remove os buckets que já teriam voltado à capacidade máxima."""
+        now = time.time() if now is None else now
+        self._connect().execute(
+            'DELETE FROM buckets WHERE tokens + (? - updated) * rate >= capacity', (now,)
+        )
+
+
+class RateLimiter:
+    """Limite de tentativas por token bucket, por IP e por nome de utilizador.
+
+    A verificação roda antes da view (e portanto antes da validação do
+    formulário, das consultas e do hash da senha). Requisições rejeitadas
+    recebem 429 com Retry-After. Atrás de um proxy, o IP real depende do
+    ProxyFix configurado em create_app (PROXY_COUNT).
+    """
+
+    def __init__(self, app=None, path=None):
+        self.path = path
+        self.enabled = True
+        self._store = None
+        self._limits = {}  # escopo -> {campo: (capacidade, taxa)} dos buckets de falhas
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.path = app.config.get('RATELIMIT_PATH', self.path)
+        self.enabled = app.config.get('RATELIMIT_ENABLED', self.enabled)
+        self._store = None
+        app.extensions['rate_limiter'] = self
+
+    @property
+    def store(self):
+        if self._store is None:
+            self._store = _BucketStore(self.path)
+        return self._store
+
+    @staticmethod
+    def _key(scope, field, value):
+        return f'{scope}:{field}:' + (value or '').strip().casefold()[:120]
+
+    def check(self, scope, ip_limit):
+        """Retorna os segundos de espera da primeira chave bloqueada, ou 0.
+
+        O bucket do IP consome um token por tentativa; os dos campos só são
+        consultados (quem os consome é `failed`).
+        """
+        if ip_limit is not None:
+            wait = self.store.take(f'{scope}:ip:{request.remote_addr or "-"}', *ip_limit)
+            if wait:
+                return wait
+        for field in self._limits.get(scope, ()):
+            value = request.form.get(field)
+            if value:
+                wait = self.store.peek(self._key(scope, field, value))
+                if wait:
+                    return wait
+        return 0
+
+    def failed(self, scope, **values):
+        """Registra uma tentativa que falhou (ex.: senha errada) nos buckets dos campos."""
+        if not self.enabled:
+            return
+        for field, value in values.items():
+            if value:
+                self.store.take(self._key(scope, field, value), *self._limits[scope][field])
+
+    def limit(self, scope, methods=('POST',), ip=None, **fields):
+        """Decorador: `@rate_limiter.limit('login', ip='20/minute', username='5/minute')`.
+
+        `ip` conta todas as tentativas. Os demais argumentos são campos do
+        formulário cujo valor vira chave de um bucket que só conta as falhas
+        informadas pela view com `failed(scope, campo=valor)`: logins bem-sucedidos
+        não gastam o limite do utilizador.
+        """
+        ip_limit = parse_limit(ip) if ip else None
+        self._limits[scope] = {field: parse_limit(limit) for field, limit in fields.items()}
+
+        def decorator(view):
+            @wraps(view)
+            def wrapped(*args, **kwargs):
+                if self.enabled and request.method in methods:
+                    wait = self.check(scope, ip_limit)
+                    if wait:
+                        return Response(
+                            'Muitas tentativas. Tente novamente mais tarde.\n', 429,
+                            {'Retry-After': str(math.ceil(wait))}, mimetype='text/plain',
+                        )
+                return view(*args, **kwargs)
+            return wrapped
+        return decorator
@@ -1,5 +1,14 @@
 # run.py
-from app import app
+from app import create_app, db, object_cache
+from app.models import Coupon
+from app.sweeper import start_coupon_sweeper
+
+app = create_app()
 
 if __name__ == '__main__':
-    app.run(debug=True)
\ No newline at end of file
+    # Cria o banco de dados e as tabelas se não existirem
+    with app.app_context():
+        db.create_all()
+    # Timer de expiração de cupons só no servidor (nunca nos comandos `flask`)
+    start_coupon_sweeper(app, Coupon, object_cache, use_reloader=True)
+    app.run(debug=True)
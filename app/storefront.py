@@ -0,0 +1,107 @@
+# app/storefront.py
+from sqlalchemy import select, text, union_all
+
+# Ordenações suportadas pela vitrine. Cada uma é atendida por um índice
+# (category_id, coluna) ou pelo índice simples da coluna.
+ORDERINGS = {
+    'newest': lambda model: (model.created_at.desc(), model.id.desc()),
+    'cheapest': lambda model: (model.price.asc(), model.id.asc()),
+}
+
+# Tamanho das listas ordenadas (?limit=) aceito pelas rotas
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 200
+
+
+def clamp_limit(value):
+    """Limita o ?limit= da requisição a 1..MAX_LIMIT (um LIMIT -1 seria ilimitado)."""
+    return max(1, min(value if value is not None else DEFAULT_LIMIT, MAX_LIMIT))
+
+
+# O SQLite aceita no máximo 500 termos num SELECT composto: as categorias são
+# consultadas em blocos com folga abaixo desse limite.
+MAX_UNION_TERMS = 400
+
+
+def chunked(ids, size=None):
+    size = size or MAX_UNION_TERMS
+    ids = list(ids)
+    return [ids[start:start + size] for start in range(0, len(ids), size)]
+
+
+def _ordering(model, order):
+    try:
+        return ORDERINGS[order](model)
+    except KeyError:
+        raise ValueError(f'Ordenação desconhecida: {order}')
+
+
+def top_query(model, order='newest', limit=20, category_id=None):
+    """Consulta dos N primeiros itens na ordem pedida, opcionalmente de uma categoria."""
+    query = model.query
+    if category_id is not None:
+        query = query.filter(model.category_id == category_id)
+    return query.order_by(*_ordering(model, order)).limit(limit)
+
+
+def top(model, order='newest', limit=20, category_id=None):
+    return top_query(model, order, limit, category_id).all()
+
+
+def top_ids_per_category_statement(model, category_ids, order='cheapest', limit=5):
+    """Um SELECT por categoria, unidos com UNION ALL, lendo apenas o índice composto.
+
+    Recebe no máximo MAX_UNION_TERMS categorias (ver `chunked`).
+    """
+    parts = []
+    for category_id in category_ids:
+        sub = (
+            select(model.id, model.category_id)
+            .where(model.category_id == category_id)
+            .order_by(*_ordering(model, order))
+            .limit(limit)
+            .subquery()
+        )
+        parts.append(select(sub.c.id, sub.c.category_id))
+    return union_all(*parts)
+
+
+def top_per_category(model, category_ids, order='cheapest', limit=5):
+    """Retorna {category_id: [itens]} com os N melhores de cada categoria."""
+    category_ids = list(category_ids)
+    result = {category_id: [] for category_id in category_ids}
+    if not category_ids:
+        return result
+
+    session = model.query.session
+    rows = []
+    for chunk in chunked(category_ids):
+        rows += session.execute(top_ids_per_category_statement(model, chunk, order, limit)).all()
+    ids = [row.id for row in rows]
+    # Carrega as linhas completas pela chave primária e mantém a ordem do índice
+    by_id = {item.id: item for item in model.query.filter(model.id.in_(ids))}
+    for row in rows:
+        result[row.category_id].append(by_id[row.id])
+    return result
+
+
+def query_plan(session, statement):
+    """Executa EXPLAIN QUERY PLAN (SQLite) e devolve as linhas de detalhe do plano."""
+    if hasattr(statement, 'statement'):
+        statement = statement.statement
+    compiled = statement.compile(
+        dialect=session.get_bind().dialect, compile_kwargs={'literal_binds': True}
+    )
+    rows = session.execute(text(f'EXPLAIN QUERY PLAN {compiled}')).all()
+    return [row[-1] for row in rows]
+
+
+def full_scans(plan):
+    """Filtra os passos do plano que varrem uma tabela inteira ou ordenam em memória."""
+    # Subconsultas materializadas como co-rotinas já vêm limitadas pelo índice
+    coroutines = {step.split()[-1] for step in plan if step.startswith('CO-ROUTINE')}
+    return [
+        step for step in plan
+        if (step.startswith('SCAN') and 'INDEX' not in step and step.split()[1] not in coroutines)
+        or 'TEMP B-TREE' in step
+    ]
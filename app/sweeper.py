@@ -0,0 +1,91 @@
+# app/sweeper.py
+import os
+import threading
+from datetime import date
+
+from sqlalchemy import update
+
+from app import changelog
+
+
+def expire_coupons(coupon_model, today=None, object_cache=None):
+    """Desativa de uma vez todos os cupons ativos com data de expiração vencida.
+
+    Um único UPDATE ... RETURNING id, pelo índice (is_active, expiration_date):
+    só os cupons realmente desativados vão para o ChangeLog e para o cache.
+    Sem RETURNING (MySQL), seleciona os ids, repete o filtro no UPDATE e relê
+    quais ficaram inativos. Retorna o número de cupons desativados.
+    """
+    today = today or date.today()
+    criteria = (
+        coupon_model.is_active == True,  # noqa: E712 (mantém o índice utilizável)
+        coupon_model.expiration_date < today,
+    )
+    session = coupon_model.query.session
+    if session.get_bind().dialect.update_returning:
+        ids = list(session.scalars(
+            update(coupon_model).where(*criteria).values(is_active=False).returning(coupon_model.id)
+        ))
+    else:
+        candidates = [row.id for row in coupon_model.query.filter(*criteria).with_entities(coupon_model.id)]
+        if candidates:
+            coupon_model.query.filter(coupon_model.id.in_(candidates), *criteria).update(
+                {coupon_model.is_active: False}, synchronize_session=False
+            )
+        # Um cupom prorrogado entre o SELECT e o UPDATE continua ativo e fica de fora
+        ids = [row.id for row in coupon_model.query.filter(
+            coupon_model.id.in_(candidates), coupon_model.is_active == False  # noqa: E712
+        ).with_entities(coupon_model.id)] if candidates else []
+    if not ids:
+        session.rollback()
+        return 0
+
+    changelog.record(session, coupon_model, ids, 'update')
+    session.commit()
+    if object_cache is not None:
+        for id in ids:
+            object_cache.invalidate(coupon_model, id)
+    return len(ids)
+
+
+class CouponSweeper:
+    """Timer opcional que roda `expire_coupons` periodicamente dentro do processo."""
+
+    def __init__(self, app, coupon_model, interval, object_cache=None):
+        self.app = app
+        self.coupon_model = coupon_model
+        self.interval = interval
+        self.object_cache = object_cache
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='coupon-sweeper', daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            with self.app.app_context():
+                try:
+                    expire_coupons(self.coupon_model, object_cache=self.object_cache)
+                except Exception:
+                    self.app.logger.exception('Falha ao expirar cupons')
+                    self.coupon_model.query.session.rollback()
+
+
+def start_coupon_sweeper(app, coupon_model, object_cache=None, use_reloader=False):
+    """Inicia o timer se COUPON_SWEEP_INTERVAL estiver definido. Só deve ser chamado pelo servidor.
+
+    Com `use_reloader`, roda apenas no processo filho do reloader, que é o
+    que serve as requisições. Em produção (vários workers) prefira `flask expire-coupons` no cron.
+    """
+    interval = app.config.get('COUPON_SWEEP_INTERVAL')
+    if not interval or (use_reloader and os.environ.get('WERKZEUG_RUN_MAIN') != 'true'):
+        return None
+    sweeper = CouponSweeper(app, coupon_model, interval, object_cache)
+    sweeper.start()
+    return sweeper
@@ -0,0 +1,85 @@
+# benchmarks/analytics.py
+# Gera 12 meses de pedidos e mede a construção do rollup e o relatório anual.
+#
+#   python benchmarks/analytics.py [pedidos]
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DATABASE_URL', 'sqlite://')
+
+from app import create_app, db, analytics  # noqa: E402
+from app.models import Category, Customer, Order, OrderItem, Product  # noqa: E402
+
+STATES = ['SP', 'RJ', 'MG', 'PR', 'SC', 'RS', 'BA', 'PE', 'GO', 'DF']
+ORIGINS = ['Brasil', 'Índia', 'México', 'Marrocos', 'Indonésia']
+
+
+def seed(orders):
+    rng = random.Random(7)
+    categories = [Category(name=f'Categoria {i}') for i in range(8)]
+    db.session.add_all(categories)
+    db.session.flush()
+    products = [
+        {'id': i + 1, 'name': f'Produto {i}', 'description': '-', 'price': 5 + i % 40, 'stock': 100, 'sku': f'SKU{i:05d}',
+         'origin': rng.choice(ORIGINS), 'spiciness_level': rng.randint(1, 5), 'category_id': rng.choice(categories).id}
+        for i in range(400)
+    ]
+    db.session.execute(Product.__table__.insert(), products)
+    customers = [
+        {'id': i + 1, 'first_name': f'Cliente {i}', 'last_name': '-', 'email': f'c{i}@example.com', 'state': rng.choice(STATES)}
+        for i in range(2000)
+    ]
+    db.session.execute(Customer.__table__.insert(), customers)
+    # Os atributos congelados na compra são informados direto (sem os defaults, que consultam linha a linha)
+    now = datetime.utcnow()
+    db.session.execute(Order.__table__.insert(), [
+        {'id': i + 1, 'customer_id': customer['id'], 'state': customer['state'], 'status': 'paid',
+         'created_at': now - timedelta(minutes=rng.randint(0, 365 * 24 * 60))}
+        for i, customer in ((i, rng.choice(customers)) for i in range(orders))
+    ])
+    db.session.execute(OrderItem.__table__.insert(), [
+        {'order_id': rng.randint(1, orders), 'product_id': product['id'], 'category_id': product['category_id'],
+         'origin': product['origin'], 'spiciness_level': product['spiciness_level'],
+         'quantity': rng.randint(1, 4), 'unit_price': 5 + rng.random() * 40}
+        for product in (rng.choice(products) for _ in range(orders * 3))
+    ])
+    db.session.commit()
+
+
+def main(orders=100_000):
+    app = create_app()
+    with app.app_context():
+        db.create_all()
+        seed(orders)
+
+        start = time.perf_counter()
+        analytics.refresh(db.session)
+        print(f'rollup inicial ({orders} pedidos): {time.perf_counter() - start:.2f} s')
+
+        customer = db.session.get(Customer, 1)
+        db.session.add(Order(customer=customer, status='paid', items=[OrderItem(product_id=1, quantity=2, unit_price=10)]))
+        db.session.commit()
+        start = time.perf_counter()
+        days = analytics.refresh(db.session)
+        print(f'rollup incremental (1 pedido novo, {len(days)} dia): {(time.perf_counter() - start) * 1000:.1f} ms')
+
+        order = db.session.get(Order, 1)
+        order.created_at -= timedelta(days=1)
+        db.session.commit()
+        start = time.perf_counter()
+        days = analytics.refresh(db.session)
+        print(f'rollup incremental (1 pedido mudou de dia, {len(days)} dias): {(time.perf_counter() - start) * 1000:.1f} ms')
+
+        for dimension in analytics.DIMENSIONS:
+            start = time.perf_counter()
+            result = analytics.report(db.session, dimension, days=365)
+            print(f'relatório 12 meses por {dimension:<10} {(time.perf_counter() - start) * 1000:7.1f} ms'
+                  f'  ({len(result["totals"])} grupos, R$ {result["revenue"]:,.2f})')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,57 @@
+# benchmarks/api.py
+# Compara a vazão da API JSON com a lista HTML de produtos do painel.
+#
+#   python benchmarks/api.py [produtos] [requisições]
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DATABASE_URL', 'sqlite://')
+
+from app import create_app, db  # noqa: E402
+from app.models import Category, Product  # noqa: E402
+
+
+def seed(count):
+    category = Category(name='Temperos')
+    db.session.add(category)
+    db.session.flush()
+    db.session.execute(Product.__table__.insert(), [
+        {'name': f'Produto {i}', 'description': 'Tempero ' * 20, 'price': 1 + i % 50, 'stock': i % 30,
+         'sku': f'SKU{i:07d}', 'origin': 'Brasil', 'spiciness_level': i % 5, 'category_id': category.id}
+        for i in range(count)
+    ])
+    db.session.commit()
+
+
+def measure(client, url, requests):
+    client.get(url)  # aquece templates e cache de compilação
+    start = time.perf_counter()
+    for _ in range(requests):
+        response = client.get(url)
+        assert response.status_code == 200, response.status_code
+    elapsed = time.perf_counter() - start
+    return requests / elapsed, len(response.data)
+
+
+def main(products=500, requests=200):
+    app = create_app()
+    with app.app_context():
+        db.create_all()
+        seed(products)
+    client = app.test_client()
+    cases = [
+        ('HTML /admin/products', '/admin/products'),
+        ('JSON completo', f'/api/products?limit={products}'),
+        ('JSON fields=id,name,price', f'/api/products?limit={products}&fields=name,price'),
+        ('JSON ids= (50)', '/api/products?ids=' + ','.join(str(i) for i in range(1, 51))),
+    ]
+    for label, url in cases:
+        rate, size = measure(client, url, requests)
+        print(f'{label:<28} {rate:8.1f} req/s  {size / 1024:8.1f} KiB')
+
+
+if __name__ == '__main__':
+    args = [int(arg) for arg in sys.argv[1:3]]
+    main(*args)
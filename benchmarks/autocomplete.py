@@ -0,0 +1,47 @@
+# benchmarks/autocomplete.py
+# Latência de /api/autocomplete sobre um índice de prefixo com 1M de termos.
+#
+#   python benchmarks/autocomplete.py [termos]
+import os
+import random
+import statistics
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.autocomplete import PrefixIndex  # noqa: E402
+
+
+def main(size=1_000_000):
+    rng = random.Random(42)
+    words = ['pimenta', 'cominho', 'canela', 'açafrão', 'páprica', 'orégano', 'cravo', 'noz-moscada']
+    items = [
+        (id, (f'SKU{id:07d}', f'{rng.choice(words)} {"".join(rng.choices(string.ascii_lowercase, k=6))}'), f'item {id}')
+        for id in range(size // 2)
+    ]
+
+    index = PrefixIndex()
+    start = time.perf_counter()
+    index.load(items)
+    print(f'carga: {len(index)} termos em {time.perf_counter() - start:.2f} s')
+
+    prefixes = [f'sku{rng.randrange(size // 2):07d}'[:rng.randint(4, 10)] for _ in range(5000)]
+    prefixes += [rng.choice(words)[:rng.randint(1, 5)] for _ in range(5000)]
+    timings = []
+    for prefix in prefixes:
+        start = time.perf_counter()
+        index.search(prefix, 10)
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    print(f'busca: mediana {statistics.median(timings) * 1e6:.1f} µs, p99 {timings[int(len(timings) * 0.99)] * 1e6:.1f} µs')
+
+    start = time.perf_counter()
+    for id in range(size // 2, size // 2 + 1000):
+        index.add(id, (f'SKU{id:07d}', 'pimenta nova'), f'item {id}')
+    print(f'inserção incremental: {(time.perf_counter() - start) / 1000 * 1e6:.1f} µs por item')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
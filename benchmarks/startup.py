@@ -0,0 +1,50 @@
+# benchmarks/startup.py
+# Mede o arranque a frio de um worker: importar o pacote e chamar create_app().
+#
+#   python benchmarks/startup.py [repetições]
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Executado em um processo novo a cada repetição (sem cache de módulos)
+CHILD = """
+import json, resource, sys, time
+start = time.perf_counter()
+from app import create_app
+app = create_app()
+elapsed = time.perf_counter() - start
+heavy = [name for name in ('flask_migrate', 'alembic', 'wtforms', 'PIL') if name in sys.modules]
+print(json.dumps({
+    'seconds': elapsed,
+    'max_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    'modules': len(sys.modules),
+    'heavy': heavy,
+}))
+"""
+
+
+def run_once():
+    env = dict(os.environ, DATABASE_URL=os.environ.get('DATABASE_URL', 'sqlite://'))
+    out = subprocess.run(
+        [sys.executable, '-c', CHILD], cwd=ROOT, env=env, check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main(repeat=10):
+    results = [run_once() for _ in range(repeat)]
+    seconds = [r['seconds'] for r in results]
+    rss = [r['max_rss_kb'] for r in results]
+    print(f'create_app() a frio ({repeat} processos)')
+    print(f'  mediana: {statistics.median(seconds) * 1000:.1f} ms  (mín {min(seconds) * 1000:.1f} ms)')
+    print(f'  RSS máximo: {statistics.median(rss) / 1024:.1f} MiB')
+    print(f'  módulos carregados: {results[-1]["modules"]}')
+    print(f'  dependências pesadas carregadas: {", ".join(results[-1]["heavy"]) or "nenhuma"}')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10)
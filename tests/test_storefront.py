@@ -0,0 +1,68 @@
+# tests/test_storefront.py
+# Os planos de consulta da vitrine precisam usar os índices compostos (sem SCAN nem TEMP B-TREE).
+import pytest
+
+from app import create_app, db, storefront
+from app.config import Config
+from app.models import Announcement, Category, Product
+
+
+class TestConfig(Config):
+    TESTING = True
+    SQLALCHEMY_DATABASE_URI = 'sqlite://'
+    OBJECT_CACHE_PATH = ''
+    RATELIMIT_ENABLED = False
+
+
+@pytest.fixture
+def session():
+    app = create_app(TestConfig)
+    with app.app_context():
+        db.create_all()
+        categories = [Category(name=f'Categoria {i}') for i in range(5)]
+        db.session.add_all(categories)
+        db.session.flush()
+        for i in range(50):
+            category = categories[i % len(categories)]
+            db.session.add(Product(name=f'Produto {i}', description='-', price=1 + i % 7, stock=1,
+                                   sku=f'SKU{i:03d}', category_id=category.id))
+            db.session.add(Announcement(title=f'Anúncio {i}', price=1 + i % 7, category_id=category.id))
+        db.session.commit()
+        yield db.session
+        db.session.remove()
+
+
+def category_ids(session):
+    return [id for id, in session.execute(db.select(Category.id))]
+
+
+@pytest.mark.parametrize('model', [Product, Announcement])
+@pytest.mark.parametrize('order', list(storefront.ORDERINGS))
+def test_top_query_uses_index(session, model, order):
+    for category_id in (None, category_ids(session)[0]):
+        statement = storefront.top_query(model, order, 20, category_id=category_id)
+        assert storefront.full_scans(storefront.query_plan(session, statement)) == []
+
+
+@pytest.mark.parametrize('model', [Product, Announcement])
+@pytest.mark.parametrize('order', list(storefront.ORDERINGS))
+def test_top_per_category_statement_uses_index(session, model, order):
+    statement = storefront.top_ids_per_category_statement(model, category_ids(session), order)
+    assert storefront.full_scans(storefront.query_plan(session, statement)) == []
+
+
+def test_top_per_category_chunks_categories(session, monkeypatch):
+    monkeypatch.setattr(storefront, 'MAX_UNION_TERMS', 2)
+    ids = category_ids(session)
+    assert len(storefront.chunked(ids)) == 3
+    best = storefront.top_per_category(Product, ids, 'cheapest', limit=3)
+    assert set(best) == set(ids)
+    for products in best.values():
+        assert len(products) == 3
+        assert [p.price for p in products] == sorted(p.price for p in products)
+
+
+def test_clamp_limit():
+    assert storefront.clamp_limit(None) == storefront.DEFAULT_LIMIT
+    assert storefront.clamp_limit(-1) == 1
+    assert storefront.clamp_limit(10 ** 6) == storefront.MAX_LIMIT